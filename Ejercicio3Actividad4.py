@@ -1,35 +1,28 @@
 # -*- coding: utf-8 -*-
 
-import math
 import tkinter as tk
 from tkinter import messagebox
 
+from nucleo.calculos import MotorCalculos
+from nucleo.instrumentacion import instrumentar
 
-class CalculosNumericos:
+
+class CalculosNumericos(MotorCalculos):
+    # Envoltorio para la GUI: los cálculos los hace el motor y aquí solo se muestran los errores
 
     @staticmethod
     def calcularLogaritmoNeperiano(valor):
-        try:
-            valor = float(valor)
-            if valor < 0:
-                raise ArithmeticError("El valor debe ser un número positivo")
-            return math.log(valor)
-        except ArithmeticError:
-            messagebox.showerror("Error", "El valor debe ser un número positivo para calcular el logaritmo")
-        except ValueError:
-            messagebox.showerror("Error", "El valor debe ser numérico para calcular el logaritmo")
+        return CalculosNumericos._mostrarResultado(MotorCalculos.logaritmoNeperiano(valor))
 
     @staticmethod
     def calcularRaizCuadrada(valor):
-        try:
-            valor = float(valor)
-            if valor < 0:
-                raise ArithmeticError("El valor debe ser un número positivo")
-            return math.sqrt(valor)
-        except ArithmeticError:
-            messagebox.showerror("Error", "El valor debe ser un número positivo para calcular la raíz cuadrada")
-        except ValueError:
-            messagebox.showerror("Error", "El valor debe ser numérico para calcular la raíz cuadrada")
+        return CalculosNumericos._mostrarResultado(MotorCalculos.raizCuadrada(valor))
+
+    @staticmethod
+    def _mostrarResultado(resultado):
+        if not resultado.ok:
+            messagebox.showerror("Error", resultado.mensaje)
+        return resultado.valor
 
 
 class VentanaPrincipal(tk.Tk):
@@ -62,23 +55,18 @@ class VentanaPrincipal(tk.Tk):
         self.txtMensaje = tk.Label(self, text="", fg="red")
         self.txtMensaje.grid(row=4, column=0, columnspan=2)
 
+    @instrumentar
     def btnCalcularActionPerformed(self):
-        numero = self.txtNumero.get()
-        logaritmo = CalculosNumericos.calcularLogaritmoNeperiano(numero)
-        raiz = CalculosNumericos.calcularRaizCuadrada(numero)
-
-        try:
-            numero_float = float(numero)
-            if numero_float > 0:
-                if logaritmo is not None and raiz is not None:
-                    self.txtLogaritmo.delete(0, tk.END)
-                    self.txtRaiz.delete(0, tk.END)
-                    self.txtLogaritmo.insert(0, f"{logaritmo:.5f}")
-                    self.txtRaiz.insert(0, f"{raiz:.5f}")
-                    self.txtMensaje.config(text="")
-        except ValueError:
-            # No hace nada aquí porque el mensaje ya se mostró desde CalculosNumericos
-            pass
+        # El número se interpreta y valida una sola vez; el motor guarda los resultados en caché
+        resultados = CalculosNumericos.calcularAmbos(self.txtNumero.get())
+        logaritmo, raiz = (CalculosNumericos._mostrarResultado(resultado) for resultado in resultados)
+
+        if logaritmo is not None and raiz is not None:
+            self.txtLogaritmo.delete(0, tk.END)
+            self.txtRaiz.delete(0, tk.END)
+            self.txtLogaritmo.insert(0, f"{logaritmo:.5f}")
+            self.txtRaiz.insert(0, f"{raiz:.5f}")
+            self.txtMensaje.config(text="")
 
     def btnLimpiarActionPerformed(self):
         self.txtNumero.delete(0, tk.END)
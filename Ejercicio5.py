@@ -1,27 +1,75 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox
-import os
-
-class LeerArchivo:
-    @staticmethod
-    def leer_archivo(ruta):
-        if not os.path.exists(ruta):
-            raise FileNotFoundError("El archivo no existe.")
-        with open(ruta, "r", encoding="utf-8") as archivo:
-            return archivo.readlines()
-
-    @staticmethod
-    def leer_en_mayusculas(ruta):
-        if not os.path.exists(ruta):
-            raise FileNotFoundError("El archivo no existe.")
-        with open(ruta, "r", encoding="utf-8") as archivo:
-            return [linea.upper() for linea in archivo.readlines()]
+from tkinter import filedialog, messagebox, ttk
+from itertools import islice
+import queue
+import time
+
+from nucleo.archivos import CargadorArchivo, LeerArchivo, LeerArchivoMapeado
+from nucleo.instrumentacion import instrumentar
+
+class VisorVirtual:
+    # Muestra en un tk.Text solo las líneas visibles (más un margen) de un LeerArchivoMapeado
+    # y pide nuevas líneas a la fuente al desplazarse
+    MARGEN = 20
+
+    def __init__(self, texto, barra):
+        self.texto = texto
+        self.barra = barra
+        self.fuente = None
+        self.mayusculas = False
+        self.primera = 0
+        self.barra.config(command=self.desplazar)
+        for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.texto.bind(evento, self._rueda)
+
+    @property
+    def alto(self):
+        return int(self.texto.cget("height"))
+
+    @instrumentar
+    def pintar(self, contenido):
+        # Se conserva el desplazamiento horizontal al repintar con otras líneas
+        columna = self.texto.xview()[0]
+        self.texto.config(state=tk.NORMAL)
+        self.texto.delete(1.0, tk.END)
+        self.texto.insert(tk.END, contenido)
+        self.texto.config(state=tk.DISABLED)
+        self.texto.xview_moveto(columna)
+
+    def mostrar(self, fuente, mayusculas):
+        self.fuente = fuente
+        self.mayusculas = mayusculas
+        self.ir_a(0)
+
+    def ir_a(self, primera):
+        total = self.fuente.lineas_disponibles
+        self.primera = max(0, min(primera, total - self.alto))
+        self.pintar(self.fuente.lineas(self.primera, self.primera + self.alto + self.MARGEN, self.mayusculas))
+        if total:
+            self.barra.set(self.primera / total, min(1.0, (self.primera + self.alto) / total))
+        else:
+            self.barra.set(0.0, 1.0)
+
+    def desplazar(self, accion, cantidad, unidad=None):
+        if self.fuente is None:
+            return
+        if accion == tk.MOVETO:
+            self.ir_a(int(float(cantidad) * self.fuente.lineas_disponibles))
+        elif accion == tk.SCROLL:
+            paso = self.alto if unidad == tk.PAGES else 1
+            self.ir_a(self.primera + int(cantidad) * paso)
+
+    def _rueda(self, evento):
+        sentido = -1 if evento.num == 4 or evento.delta > 0 else 1
+        self.desplazar(tk.SCROLL, 3 * sentido, tk.UNITS)
+        return "break"
+
 
 class LeerArchivoGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Lector de Archivos")
-        self.root.geometry("600x400")
+        self.root.geometry("600x520")
 
         tk.Label(root, text="Ruta del archivo:").pack(pady=5)
         self.entry = tk.Entry(root, width=60)
@@ -31,8 +79,27 @@ class LeerArchivoGUI:
         tk.Button(root, text="Leer Archivo", command=self.leer).pack(pady=5)
         tk.Button(root, text="Leer en Mayúsculas", command=self.leer_mayusculas).pack(pady=5)
 
-        self.texto = tk.Text(root, wrap=tk.WORD, height=15, width=70)
-        self.texto.pack(pady=10)
+        marco = tk.Frame(root)
+        marco.pack(pady=10)
+        self.barra = tk.Scrollbar(marco, orient=tk.VERTICAL)
+        self.barra.pack(side=tk.RIGHT, fill=tk.Y)
+        # Sin ajuste de línea: el visor cuenta líneas del archivo, no líneas en pantalla, así que
+        # las líneas largas se recorren con la barra horizontal
+        barra_horizontal = tk.Scrollbar(marco, orient=tk.HORIZONTAL)
+        barra_horizontal.pack(side=tk.BOTTOM, fill=tk.X)
+        self.texto = tk.Text(marco, wrap=tk.NONE, height=15, width=70, xscrollcommand=barra_horizontal.set)
+        self.texto.pack(side=tk.LEFT)
+        barra_horizontal.config(command=self.texto.xview)
+        self.progreso = ttk.Progressbar(root, length=400, mode="determinate")
+        self.progreso.pack()
+        self.btn_cancelar = tk.Button(root, text="Cancelar", command=self.cancelar_carga, state=tk.DISABLED)
+        self.btn_cancelar.pack(pady=5)
+        self.lbl_estado = tk.Label(root, text="", fg="gray")
+        self.lbl_estado.pack()
+
+        self.visor = VisorVirtual(self.texto, self.barra)
+        self.fuente = None
+        self.cargador = None
 
     def buscar_archivo(self):
         ruta = filedialog.askopenfilename(title="Seleccionar archivo", filetypes=[("Archivos de texto", "*.txt")])
@@ -41,22 +108,90 @@ class LeerArchivoGUI:
             self.entry.insert(0, ruta)
 
     def leer(self):
-        self.mostrar_contenido(LeerArchivo.leer_archivo)
+        self.mostrar_contenido(mayusculas=False)
 
     def leer_mayusculas(self):
-        self.mostrar_contenido(LeerArchivo.leer_en_mayusculas)
+        self.mostrar_contenido(mayusculas=True)
 
-    def mostrar_contenido(self, funcion):
-        self.texto.delete(1.0, tk.END)
+    @instrumentar
+    def mostrar_contenido(self, mayusculas):
+        self._inicio_carga = time.perf_counter()
+        self._primer_pintado = None
+        self._mayusculas = mayusculas
+        self._detener_carga()
+        self.visor.pintar("")
         ruta = self.entry.get()
         try:
-            lineas = funcion(ruta)
-            for linea in lineas:
-                self.texto.insert(tk.END, linea)
+            # Primer pintado inmediato con las primeras líneas leídas en streaming
+            primeras = islice(LeerArchivo.iterar_lineas(ruta, mayusculas), self.visor.alto + self.visor.MARGEN)
+            self.visor.pintar("".join(primeras))
+            self.texto.update_idletasks()
+            self._primer_pintado = time.perf_counter() - self._inicio_carga
+            self.fuente = LeerArchivoMapeado(ruta)
         except FileNotFoundError:
             messagebox.showerror("Error", "El archivo no existe.")
+            return
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo leer el archivo:\n{e}")
+            return
+
+        # El índice de líneas se construye en segundo plano; la GUI solo recibe el progreso
+        self.progreso.config(maximum=max(self.fuente.tamaño, 1), value=0)
+        self.btn_cancelar.config(state=tk.NORMAL)
+        self.cargador = CargadorArchivo(self.fuente)
+        self.cargador.iniciar()
+        self.root.after(50, self._drenar_cola, self.cargador)
+
+    def cancelar_carga(self):
+        if self.cargador is not None:
+            self.cargador.cancelar()
+
+    def _detener_carga(self):
+        if self.cargador is not None:
+            self.cargador.cancelar()
+            self.cargador = None
+        if self.fuente is not None:
+            # El visor no debe seguir apuntando a un mapa cerrado si la nueva apertura falla
+            self.visor.fuente = None
+            self.fuente.cerrar()
+            self.fuente = None
+
+    @instrumentar
+    def _drenar_cola(self, cargador):
+        if cargador is not self.cargador:
+            return
+        estado, dato = "lote", None
+        while True:
+            try:
+                estado, dato = cargador.cola.get_nowait()
+            except queue.Empty:
+                break
+            if estado != "error":
+                self.progreso.config(value=dato)
+
+        fuente = cargador.fuente
+        if estado == "error":
+            self.btn_cancelar.config(state=tk.DISABLED)
+            messagebox.showerror("Error", f"No se pudo leer el archivo:\n{dato}")
+            return
+        if self.visor.fuente is None:
+            if fuente.lineas_disponibles >= self.visor.alto + self.visor.MARGEN or estado != "lote":
+                self.visor.mostrar(fuente, self._mayusculas)
+        else:
+            # Refresca la ventana visible y la barra ahora que hay más líneas indexadas
+            self.visor.ir_a(self.visor.primera)
+
+        resumen = f"{fuente.lineas_disponibles} líneas · primer pintado: {self._primer_pintado * 1000:.1f} ms"
+        if estado == "lote":
+            self.lbl_estado.config(text=f"Cargando... {resumen}")
+            self.root.after(50, self._drenar_cola, cargador)
+            return
+        self.btn_cancelar.config(state=tk.DISABLED)
+        if estado == "cancelado":
+            self.lbl_estado.config(text=f"Carga cancelada · {resumen}")
+        else:
+            total = time.perf_counter() - self._inicio_carga
+            self.lbl_estado.config(text=f"{resumen} · carga total: {total:.2f} s")
 
 if __name__ == "__main__":
     root = tk.Tk()
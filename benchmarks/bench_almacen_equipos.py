@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Mide el rendimiento de AlmacenEquipos: inserción por lotes y latencia de consultas.
+
+    python -m benchmarks.bench_almacen_equipos [número de equipos]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from nucleo.maraton import AlmacenEquipos, EquipoMaratonProgramacion, Programador
+
+LENGUAJES = ("Python", "Java", "C++", "C#", "Go", "Rust", "JavaScript", "Kotlin")
+NOMBRES = ("Ana", "Luis", "Pedro", "Maria", "Sofia", "Juan", "Lucia", "Carlos", "Elena", "Diego")
+
+
+def generar_equipos(n, semilla=7):
+    aleatorio = random.Random(semilla)
+    for i in range(n):
+        equipo = EquipoMaratonProgramacion(f"Equipo{i}", f"Universidad{aleatorio.randrange(300)}",
+                                           aleatorio.choice(LENGUAJES))
+        for _ in range(aleatorio.randint(2, 3)):
+            equipo.añadir(Programador(aleatorio.choice(NOMBRES), f"Apellido{aleatorio.randrange(100_000)}"))
+        yield equipo
+
+
+def _latencia(funcion, repeticiones=50):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000, len(resultado)
+
+
+def main(n=100_000):
+    with tempfile.TemporaryDirectory() as carpeta:
+        with AlmacenEquipos(os.path.join(carpeta, "equipos.db")) as almacen:
+            equipos = list(generar_equipos(n))
+            lote = AlmacenEquipos.EQUIPOS_POR_TRANSACCION
+            inicio = time.perf_counter()
+            for i in range(0, n, lote):
+                almacen.guardar_varios(equipos[i:i + lote])
+            duracion = time.perf_counter() - inicio
+            print(f"Inserción: {n} equipos en {duracion:.2f} s ({n / duracion:,.0f} equipos/s)")
+
+            consultas = (
+                ("Python de Universidad42", lambda: almacen.buscar("Universidad42", "python"), 50),
+                ("todos de Universidad42", lambda: almacen.buscar(universidad="Universidad42"), 50),
+                ("por nombre de equipo", lambda: almacen.buscar_por_nombre(f"Equipo{n // 2}"), 50),
+                ("todos los de Rust", lambda: almacen.buscar(lenguaje="Rust"), 3),
+                ("programadores duplicados", almacen.programadores_duplicados, 3),
+            )
+            print(f"{'consulta':<28}{'ms':>10}{'resultados':>12}")
+            for descripcion, consulta, repeticiones in consultas:
+                milisegundos, resultados = _latencia(consulta, repeticiones)
+                print(f"{descripcion:<28}{milisegundos:>10.3f}{resultados:>12}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
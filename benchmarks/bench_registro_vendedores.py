@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Compara las consultas de RegistroVendedores con un recorrido lineal de la lista.
+
+    python -m benchmarks.bench_registro_vendedores [número de vendedores]
+"""
+
+import random
+import sys
+import time
+from itertools import islice
+
+from nucleo.vendedores import RegistroVendedores, Vendedor
+
+
+def _tiempo_medio(funcion, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def generar_vendedores(n, semilla=42):
+    aleatorio = random.Random(semilla)
+    vendedores = []
+    for i in range(n):
+        vendedor = Vendedor(f"Nombre{aleatorio.randrange(20_000)}", f"Apellido{aleatorio.randrange(200_000)}")
+        vendedor.edad = aleatorio.randint(18, 80)
+        vendedores.append(vendedor)
+    return vendedores
+
+
+def main(n=1_000_000):
+    vendedores = generar_vendedores(n)
+
+    inicio = time.perf_counter()
+    registro = RegistroVendedores()
+    registro.agregar_varios(vendedores)
+    registro.buscar_por_edad(0, 0)  # Fuerza la construcción de los índices ordenados
+    print(f"Índices para {n} vendedores construidos en {time.perf_counter() - inicio:.2f} s")
+
+    nombre = vendedores[n // 2].nombre
+    apellidos = vendedores[n // 3].apellidos
+    consultas = (
+        ("nombre", lambda: registro.buscar_por_nombre(nombre),
+         lambda: [v for v in vendedores if v.nombre == nombre]),
+        ("apellidos", lambda: registro.buscar_por_apellidos(apellidos),
+         lambda: [v for v in vendedores if v.apellidos == apellidos]),
+        ("prefijo 'Apellido1234'", lambda: registro.buscar_por_prefijo_apellidos("Apellido1234"),
+         lambda: [v for v in vendedores if v.apellidos.startswith("Apellido1234")]),
+        ("edad 30-31", lambda: registro.buscar_por_edad(30, 31),
+         lambda: [v for v in vendedores if 30 <= v.edad <= 31]),
+        ("edad 30-40", lambda: registro.buscar_por_edad(30, 40),
+         lambda: [v for v in vendedores if 30 <= v.edad <= 40]),
+    )
+    print(f"{'consulta':<24}{'índice (ms)':>14}{'lineal (ms)':>14}{'resultados':>12}")
+    for descripcion, indexada, lineal in consultas:
+        assert len(indexada()) == len(lineal())
+        t_indice = _tiempo_medio(indexada, 200)
+        t_lineal = _tiempo_medio(lineal, 3)
+        print(f"{descripcion:<24}{t_indice * 1000:>14.4f}{t_lineal * 1000:>14.1f}{len(indexada()):>12}")
+
+    # Una alta seguida de una consulta: las altas recientes no deben obligar a reconstruir los índices
+    altas = iter(generar_vendedores(10_000, semilla=7))
+    alta_y_consultas = (
+        ("alta + edad 30-40", lambda: registro.buscar_por_edad(30, 40)),
+        ("alta + prefijo", lambda: registro.buscar_por_prefijo_apellidos("Apellido1234")),
+    )
+    print(f"{'alta y consulta':<24}{'media (ms)':>14}{'peor (ms)':>14}")
+    for descripcion, consulta in alta_y_consultas:
+        tiempos = []
+        for _ in range(200):
+            registro.agregar(next(altas))
+            inicio = time.perf_counter()
+            consulta()
+            tiempos.append(time.perf_counter() - inicio)
+        print(f"{descripcion:<24}{sum(tiempos) / len(tiempos) * 1000:>14.4f}{max(tiempos) * 1000:>14.4f}")
+
+    # Al superar LIMITE_PENDIENTES las altas se fusionan con los índices principales
+    registro.agregar_varios(islice(altas, RegistroVendedores.LIMITE_PENDIENTES))
+    inicio = time.perf_counter()
+    registro.buscar_por_edad(30, 40)
+    print(f"Fusión de {RegistroVendedores.LIMITE_PENDIENTES}+ altas pendientes: "
+          f"{(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Compara la validación con excepciones frente a la API de códigos de error
+sobre datos con un 20 % de entradas inválidas, como los de producción.
+
+    python -m benchmarks.bench_ruta_error [número de entradas] [proporción inválida]
+"""
+
+import random
+import sys
+import time
+
+from nucleo.division import PruebaExcepciones
+from nucleo.maraton import EquipoMaratonProgramacion, ErrorCampoInvalido, ErrorEquipoLleno, Programador
+from nucleo.vendedores import Vendedor
+
+
+def _mejor_tiempo(funcion, datos, repeticiones=11):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(datos)
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+def generar_datos(n, proporcion, semilla=2025):
+    aleatorio = random.Random(semilla)
+
+    def elegir(valido, invalido):
+        return [invalido() if aleatorio.random() < proporcion else valido() for _ in range(n)]
+
+    return {
+        "edades": elegir(lambda: aleatorio.randint(18, 90), lambda: aleatorio.choice((5, 17, -3, 130))),
+        "campos": elegir(lambda: aleatorio.choice(("Ana", "Luis", "Ruiz Gómez")),
+                         lambda: aleatorio.choice(("Ana3", "Maximiliano Alejandro"))),
+        "divisores": elegir(lambda: f"{aleatorio.uniform(1, 100):.2f}", lambda: aleatorio.choice(("0", "x"))),
+    }
+
+
+# Rutas con excepciones, escritas como el código anterior a la API de códigos
+
+def _dividir(a, b):
+    try:
+        return float(a) / float(b), PruebaExcepciones.ESTADO_OK
+    except ZeroDivisionError:
+        return None, PruebaExcepciones.ESTADO_DIVISION_CERO
+    except ValueError:
+        return None, PruebaExcepciones.ESTADO_INVALIDO
+
+
+def edades_con_excepciones(edades):
+    vendedor = Vendedor("Ana", "Ruiz")
+    for edad in edades:
+        try:
+            vendedor.verificarEdad(edad)
+        except ValueError:
+            pass
+
+
+def campos_con_excepciones(campos):
+    for campo in campos:
+        try:
+            EquipoMaratonProgramacion.validar_campo(campo)
+        except ErrorCampoInvalido:
+            pass
+
+
+def dividir_con_excepciones(divisores):
+    for divisor in divisores:
+        _dividir("10", divisor)
+
+
+def añadir_con_excepciones(campos):
+    # Cuatro intentos por equipo: el cuarto siempre encuentra el equipo lleno
+    for i in range(0, len(campos) - 3, 4):
+        equipo = EquipoMaratonProgramacion("Equipo", "Universidad", "Python")
+        for campo in campos[i:i + 4]:
+            try:
+                equipo.añadir(Programador(campo, campo))
+            except ErrorEquipoLleno:
+                pass
+
+
+# Rutas con códigos de error
+
+def edades_con_codigos(edades):
+    vendedor = Vendedor("Ana", "Ruiz")
+    for edad in edades:
+        vendedor.asignarEdad(edad)
+
+
+def campos_con_codigos(campos):
+    for campo in campos:
+        EquipoMaratonProgramacion.codigo_campo(campo)
+
+
+def dividir_con_codigos(divisores):
+    dividir = PruebaExcepciones.dividirConEstado
+    for divisor in divisores:
+        dividir("10", divisor)
+
+
+def añadir_con_codigos(campos):
+    for i in range(0, len(campos) - 3, 4):
+        equipo = EquipoMaratonProgramacion("Equipo", "Universidad", "Python")
+        for campo in campos[i:i + 4]:
+            equipo.añadir_si_cabe(Programador(campo, campo))
+
+
+def main(n=200_000, proporcion=0.2):
+    datos = generar_datos(n, proporcion)
+    casos = (
+        ("edad del vendedor", "edades", edades_con_excepciones, edades_con_codigos),
+        ("campo de programador", "campos", campos_con_excepciones, campos_con_codigos),
+        ("división", "divisores", dividir_con_excepciones, dividir_con_codigos),
+        ("añadir programador", "campos", añadir_con_excepciones, añadir_con_codigos),
+    )
+    print(f"{n} entradas, {proporcion:.0%} inválidas")
+    print(f"{'caso':<24}{'excepciones (op/s)':>20}{'códigos (op/s)':>18}{'mejora':>9}")
+    for descripcion, clave, con_excepciones, con_codigos in casos:
+        t_excepciones = _mejor_tiempo(con_excepciones, datos[clave])
+        t_codigos = _mejor_tiempo(con_codigos, datos[clave])
+        print(f"{descripcion:<24}{n / t_excepciones:>20,.0f}{n / t_codigos:>18,.0f}"
+              f"{t_excepciones / t_codigos:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(sys.argv[1]),) if len(sys.argv) > 1 else (),
+         *(float(sys.argv[2]),) if len(sys.argv) > 2 else ())
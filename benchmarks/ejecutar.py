@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+Banco de pruebas de rendimiento de las rutas críticas de todos los ejercicios.
+
+    python -m benchmarks.ejecutar                          # ejecuta y muestra los resultados
+    python -m benchmarks.ejecutar --guardar base.json      # guarda los resultados como JSON
+    python -m benchmarks.ejecutar --base base.json         # falla si algo es más lento que la base
+    python -m benchmarks.ejecutar --tamaños 1K,1M,100M,1G  # tamaños de los archivos generados
+    python -m benchmarks.ejecutar -k archivo               # solo los casos cuyo nombre contiene "archivo"
+
+No necesita GUI. Los datos se generan con una semilla fija y, como en producción,
+alrededor del 20 % de las entradas son inválidas. Como en timeit.autorange, cada
+repetición llama al caso tantas veces como haga falta para durar al menos
+DURACION_MINIMA_S, y se guardan la mediana, el mínimo y la dispersión del tiempo por
+llamada. La comparación con la base usa el mínimo, mucho menos sensible al ruido de la
+máquina; admite además la dispersión que tuvo la propia base y RUIDO_MINIMO_S por llamada,
+exige al menos REPETICIONES_MINIMAS repeticiones (también al guardar una base) y vuelve
+a medir cada caso sospechoso antes de declarar una regresión.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timezone
+
+from nucleo.archivos import LeerArchivo, LeerArchivoMapeado
+from nucleo.calculos import MotorCalculos
+from nucleo.division import PruebaExcepciones
+from nucleo.maraton import EquipoMaratonProgramacion, ErrorCampoInvalido, ErrorEquipoLleno, Programador
+from nucleo.vendedores import Vendedor
+
+N = 100_000
+PROPORCION_INVALIDA = 0.2
+# Por encima de este tamaño no se mide leer_archivo, que carga todas las líneas en memoria
+LIMITE_LECTURA_COMPLETA = 128 * 1024 * 1024
+# Con menos repeticiones el mínimo todavía es demasiado ruidoso para decidir una regresión
+REPETICIONES_MINIMAS = 5
+# Duración mínima de cada repetición: ningún caso se mide con una sola llamada de microsegundos
+DURACION_MINIMA_S = 0.2
+# Diferencias por llamada por debajo de este valor son ruido del reloj y del sistema, no regresiones
+RUIDO_MINIMO_S = 50e-6
+UNIDADES = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+# ==============================================================================
+# Datos de entrada
+# ==============================================================================
+
+def _es_invalido(aleatorio):
+    return aleatorio.random() < PROPORCION_INVALIDA
+
+
+def datos_division(aleatorio):
+    numeradores = [aleatorio.uniform(-1000, 1000) for _ in range(N)]
+    denominadores = [0.0 if _es_invalido(aleatorio) else aleatorio.uniform(1, 100) for _ in range(N)]
+    return numeradores, denominadores
+
+
+def datos_calculos(aleatorio):
+    # Textos como los que escribe un operador: negativos y no numéricos entre los válidos
+    valores = []
+    for _ in range(N):
+        if _es_invalido(aleatorio):
+            valores.append(aleatorio.choice(("-4.5", "abc", "", "12,5")))
+        else:
+            valores.append(f"{aleatorio.uniform(0.001, 10_000):.3f}")
+    return valores
+
+
+def datos_edades(aleatorio):
+    return [aleatorio.choice((-3, 5, 17, 130)) if _es_invalido(aleatorio) else aleatorio.randint(18, 90)
+            for _ in range(N)]
+
+
+def datos_campos(aleatorio):
+    campos = []
+    for i in range(N):
+        if _es_invalido(aleatorio):
+            campos.append(aleatorio.choice((f"Ana{i % 10}", "Maximiliano Alejandro")))
+        else:
+            campos.append(aleatorio.choice(("Ana", "Luis", "María", "Pedro", "Ruiz Gómez", "Fernández")))
+    return campos
+
+
+def generar_archivo(carpeta, tamaño):
+    ruta = os.path.join(carpeta, f"archivo_{tamaño}.txt")
+    bloque = "".join(f"Línea de ejemplo número {i} con algo de texto\n" for i in range(20_000))
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        escritos = 0
+        while escritos < tamaño:
+            parte = bloque[: tamaño - escritos]
+            archivo.write(parte)
+            escritos += len(parte.encode("utf-8"))
+    return ruta
+
+
+# ==============================================================================
+# Casos. Cada caso devuelve el número de operaciones que realizó.
+# ==============================================================================
+
+def caso_dividir(numeradores, denominadores):
+    dividir = PruebaExcepciones.dividir
+    for a, b in zip(numeradores, denominadores):
+        dividir(a, b)
+    return len(numeradores)
+
+
+def caso_dividir_lote(numeradores, denominadores):
+    PruebaExcepciones.dividirLote(numeradores, denominadores)
+    return len(numeradores)
+
+
+def caso_dividir_con_estado(numeradores, denominadores):
+    dividir = PruebaExcepciones.dividirConEstado
+    for a, b in zip(numeradores, denominadores):
+        dividir(a, b)
+    return len(numeradores)
+
+
+def caso_logaritmo_y_raiz(valores):
+    for valor in valores:
+        MotorCalculos.logaritmoNeperiano(valor)
+        MotorCalculos.raizCuadrada(valor)
+    return len(valores)
+
+
+def caso_calcular_ambos(valores):
+    MotorCalculos.limpiarCache()
+    for valor in valores:
+        MotorCalculos.calcularAmbos(valor)
+    return len(valores)
+
+
+def caso_calculos_lote(valores):
+    MotorCalculos.calcularLogaritmosNeperianos(valores)
+    MotorCalculos.calcularRaicesCuadradas(valores)
+    return len(valores)
+
+
+def caso_verificar_edad(edades):
+    vendedor = Vendedor("Ana", "Ruiz")
+    for edad in edades:
+        try:
+            vendedor.verificarEdad(edad)
+        except ValueError:
+            pass
+    return len(edades)
+
+
+def caso_asignar_edad(edades):
+    vendedor = Vendedor("Ana", "Ruiz")
+    for edad in edades:
+        vendedor.asignarEdad(edad)
+    return len(edades)
+
+
+def caso_validar_edades(edades):
+    Vendedor.validarEdades(edades)
+    return len(edades)
+
+
+def caso_validar_campo(campos):
+    for campo in campos:
+        try:
+            EquipoMaratonProgramacion.validar_campo(campo)
+        except ErrorCampoInvalido:
+            pass
+    return len(campos)
+
+
+def caso_codigo_campo(campos):
+    for campo in campos:
+        EquipoMaratonProgramacion.codigo_campo(campo)
+    return len(campos)
+
+
+def caso_validar_campos(campos):
+    EquipoMaratonProgramacion.validar_campos(campos)
+    return len(campos)
+
+
+def caso_añadir(campos):
+    # Equipos de tres programadores con un cuarto intento que falla por equipo lleno
+    equipos = len(campos) // 4
+    for i in range(equipos):
+        equipo = EquipoMaratonProgramacion(f"Equipo{i}", "Universidad", "Python")
+        for campo in campos[4 * i: 4 * i + 4]:
+            try:
+                equipo.añadir(Programador(campo, campo))
+            except ErrorEquipoLleno:
+                pass
+    return 4 * equipos
+
+
+def caso_leer_archivo(ruta):
+    return len(LeerArchivo.leer_archivo(ruta))
+
+
+def caso_iterar_lineas(ruta):
+    return sum(1 for _ in LeerArchivo.iterar_lineas(ruta, mayusculas=True))
+
+
+def caso_iterar_bloques(ruta):
+    return sum(len(bloque) for bloque in LeerArchivo.iterar_bloques(ruta, mayusculas=True))
+
+
+def caso_indice_mapeado(ruta):
+    with LeerArchivoMapeado(ruta) as fuente:
+        fuente.construir_indice()
+        return fuente.lineas_disponibles
+
+
+# ==============================================================================
+# Ejecución
+# ==============================================================================
+
+def definir_casos(carpeta, tamaños, filtro=""):
+    """Devuelve una lista de (nombre, función, argumentos) con los casos cuyo nombre contiene `filtro`."""
+    aleatorio = random.Random(2025)
+    division = datos_division(aleatorio)
+    valores = datos_calculos(aleatorio)
+    edades = datos_edades(aleatorio)
+    campos = datos_campos(aleatorio)
+    casos = [
+        ("division.dividir", caso_dividir, division),
+        ("division.dividirConEstado", caso_dividir_con_estado, division),
+        ("division.dividirLote", caso_dividir_lote, division),
+        ("calculos.logaritmo_y_raiz", caso_logaritmo_y_raiz, (valores,)),
+        ("calculos.calcularAmbos", caso_calcular_ambos, (valores,)),
+        ("calculos.lote", caso_calculos_lote, (valores,)),
+        ("vendedor.verificarEdad", caso_verificar_edad, (edades,)),
+        ("vendedor.asignarEdad", caso_asignar_edad, (edades,)),
+        ("vendedor.validarEdades", caso_validar_edades, (edades,)),
+        ("maraton.validar_campo", caso_validar_campo, (campos,)),
+        ("maraton.codigo_campo", caso_codigo_campo, (campos,)),
+        ("maraton.validar_campos", caso_validar_campos, (campos,)),
+        ("maraton.añadir", caso_añadir, (campos,)),
+    ]
+    for texto, tamaño in tamaños:
+        casos_archivo = [
+            (f"archivo.{nombre}[{texto}]", funcion)
+            for nombre, funcion in (("leer_archivo", caso_leer_archivo), ("iterar_lineas", caso_iterar_lineas),
+                                    ("iterar_bloques", caso_iterar_bloques), ("indice_mapeado", caso_indice_mapeado))
+            if filtro in f"archivo.{nombre}[{texto}]"
+            and (funcion is not caso_leer_archivo or tamaño <= LIMITE_LECTURA_COMPLETA)
+        ]
+        if casos_archivo:
+            ruta = generar_archivo(carpeta, tamaño)
+            casos.extend((nombre, funcion, (ruta,)) for nombre, funcion in casos_archivo)
+    return [caso for caso in casos if filtro in caso[0]]
+
+
+def medir(funcion, argumentos, repeticiones):
+    # Una ejecución previa sin medir carga NumPy, calienta cachés y deja el archivo en la caché del sistema
+    operaciones = funcion(*argumentos)
+    temporizador = timeit.Timer(lambda: funcion(*argumentos))
+    llamadas, duracion = temporizador.autorange()
+    if duracion < DURACION_MINIMA_S:
+        llamadas = max(llamadas, round(llamadas * DURACION_MINIMA_S / duracion))
+    tiempos = [temporizador.timeit(llamadas) / llamadas for _ in range(repeticiones)]
+    mediana = statistics.median(tiempos)
+    minimo = min(tiempos)
+    return {
+        "mediana_s": mediana,
+        "minimo_s": minimo,
+        # Dispersión relativa entre repeticiones: cuánto se mueve el caso con el ruido de esta máquina
+        "dispersion": (max(tiempos) - minimo) / minimo if minimo else 0.0,
+        "llamadas_por_repeticion": llamadas,
+        "operaciones": operaciones,
+        "ns_por_operacion": mediana / operaciones * 1e9 if operaciones else None,
+    }
+
+
+def limite_regresion(anterior, tolerancia):
+    """:return: Tiempo por llamada a partir del cual un caso se considera más lento que en la base."""
+    return anterior["minimo_s"] * (1 + tolerancia + anterior.get("dispersion", 0.0)) + RUIDO_MINIMO_S
+
+
+def comparar(resultados, base, tolerancia):
+    """:return: Lista de (caso, mínimo base, mínimo actual) de los casos más lentos que la base."""
+    regresiones = []
+    for nombre, actual in resultados.items():
+        anterior = base.get(nombre)
+        if anterior and actual["minimo_s"] > limite_regresion(anterior, tolerancia):
+            regresiones.append((nombre, anterior["minimo_s"], actual["minimo_s"]))
+    return regresiones
+
+
+def _tamaño(texto):
+    texto = texto.strip().upper()
+    if texto[-1] in UNIDADES:
+        return texto, int(float(texto[:-1]) * UNIDADES[texto[-1]])
+    return texto, int(texto)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banco de pruebas de rendimiento de la Actividad 4.")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--tamaños", default="1K,1M,100M", help="Tamaños de los archivos generados (K, M, G)")
+    parser.add_argument("-k", dest="filtro", default="", help="Ejecuta solo los casos cuyo nombre contenga este texto")
+    parser.add_argument("--guardar", metavar="RUTA", help="Guarda los resultados en este archivo JSON")
+    parser.add_argument("--base", metavar="RUTA", help="JSON de una ejecución anterior con el que comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="Lentitud máxima admitida frente a la base (0.25 = 25 %%)")
+    args = parser.parse_args(argv)
+    if (args.base or args.guardar) and args.repeticiones < REPETICIONES_MINIMAS:
+        parser.error(f"--base y --guardar necesitan al menos --repeticiones {REPETICIONES_MINIMAS}")
+
+    base = None
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)["resultados"]
+
+    tamaños = [_tamaño(texto) for texto in args.tamaños.split(",") if texto.strip()]
+    resultados = {}
+    regresiones = []
+    with tempfile.TemporaryDirectory() as carpeta:
+        casos = definir_casos(carpeta, tamaños, args.filtro)
+        for nombre, funcion, argumentos in casos:
+            resultados[nombre] = medir(funcion, argumentos, args.repeticiones)
+            r = resultados[nombre]
+            print(f"{nombre:<34}{r['mediana_s'] * 1000:>12.3f} ms{r['ns_por_operacion'] or 0:>14.1f} ns/op"
+                  f"{r['dispersion']:>9.0%} disp.")
+
+        if base is not None:
+            # Un caso que parece más lento se vuelve a medir antes de darlo por regresión:
+            # una ráfaga de ruido rara vez afecta a dos tandas seguidas
+            sospechosos = {nombre for nombre, _, _ in comparar(resultados, base, args.tolerancia)}
+            for nombre, funcion, argumentos in casos:
+                if nombre in sospechosos:
+                    nueva = medir(funcion, argumentos, args.repeticiones)
+                    resultados[nombre]["minimo_s"] = min(resultados[nombre]["minimo_s"], nueva["minimo_s"])
+            regresiones = comparar(resultados, base, args.tolerancia)
+
+    informe = {
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "plataforma": platform.platform(),
+        "repeticiones": args.repeticiones,
+        "resultados": resultados,
+    }
+    if args.guardar:
+        with open(args.guardar, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, ensure_ascii=False, indent=2)
+
+    for nombre, anterior, actual in regresiones:
+        print(f"REGRESIÓN {nombre}: {anterior * 1000:.2f} ms -> {actual * 1000:.2f} ms", file=sys.stderr)
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
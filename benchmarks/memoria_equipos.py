@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Mide los bytes por equipo (con sus programadores) en la representación original
+(__dict__ + lista + contador) y en la compacta (__slots__ + tupla + textos internados).
+
+    python -m benchmarks.memoria_equipos [número de equipos]
+
+Universidad y lenguaje se crean como textos nuevos en cada equipo, igual que al
+leerlos de un archivo, para que se vea el efecto de internarlos.
+"""
+
+import random
+import sys
+import tracemalloc
+
+from nucleo.maraton import EquipoMaratonProgramacion, Programador
+
+
+class ProgramadorConDict:
+    def __init__(self, nombre, apellidos):
+        self.nombre = nombre
+        self.apellidos = apellidos
+
+
+class EquipoConDict:
+    # Representación original del equipo
+    def __init__(self, nombreEquipo, universidad, lenguajeProgramacion):
+        self.nombreEquipo = nombreEquipo
+        self.universidad = universidad
+        self.lenguajeProgramacion = lenguajeProgramacion
+        self.programadores = []
+        self.tamañoEquipo = 0
+
+    def añadir(self, programador):
+        self.programadores.append(programador)
+        self.tamañoEquipo += 1
+
+
+def _datos(n, semilla=3):
+    aleatorio = random.Random(semilla)
+    lenguajes = ("Python", "Java", "C++", "Go")
+    return [
+        (f"Equipo{i}", aleatorio.randrange(300), aleatorio.choice(lenguajes),
+         [(f"Nombre{aleatorio.randrange(500)}", f"Apellido{aleatorio.randrange(50_000)}")
+          for _ in range(aleatorio.randint(2, 3))])
+        for i in range(n)
+    ]
+
+
+def _medir(datos, clase_equipo, clase_programador):
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    equipos = []
+    for nombre, universidad, lenguaje, programadores in datos:
+        # "".join crea un texto nuevo en cada equipo, como al leer una línea de un archivo
+        equipo = clase_equipo(nombre, "".join(("Universidad ", str(universidad))), "".join((lenguaje, "")))
+        for nombre_prog, apellidos in programadores:
+            equipo.añadir(clase_programador(nombre_prog, apellidos))
+        equipos.append(equipo)
+    usado = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    return usado
+
+
+def main(n=100_000):
+    datos = _datos(n)
+    for descripcion, clase_equipo, clase_programador in (
+        ("original", EquipoConDict, ProgramadorConDict),
+        ("compacta", EquipoMaratonProgramacion, Programador),
+    ):
+        print(f"{descripcion:>9}: {_medir(datos, clase_equipo, clase_programador) / n:7.1f} bytes/equipo")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
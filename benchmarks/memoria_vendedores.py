@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Mide los bytes por registro de vendedor en cada representación.
+
+    python -m benchmarks.memoria_vendedores [número de registros]
+
+Los textos se crean antes de medir, así que la cifra corresponde solo al
+contenedor de cada registro y no a los nombres en sí.
+"""
+
+import sys
+import tracemalloc
+
+from nucleo.vendedores import TablaVendedores, Vendedor
+
+
+class VendedorConDict:
+    # Representación original: un objeto con __dict__ por vendedor
+    def __init__(self, nombre, apellidos):
+        self.nombre = nombre
+        self.apellidos = apellidos
+        self.edad = 0
+
+
+def _medir(construir):
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    registros = construir()
+    usado = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    return usado, registros
+
+
+def main(n=200_000):
+    nombres = [f"Nombre{i % 1000}" for i in range(n)]
+    apellidos = [f"Apellido{i % 5000}" for i in range(n)]
+    edades = [18 + i % 60 for i in range(n)]
+
+    def con_dict():
+        registros = []
+        for nombre, apellido, edad in zip(nombres, apellidos, edades):
+            vendedor = VendedorConDict(nombre, apellido)
+            vendedor.edad = edad
+            registros.append(vendedor)
+        return registros
+
+    def con_slots():
+        registros = []
+        for nombre, apellido, edad in zip(nombres, apellidos, edades):
+            vendedor = Vendedor(nombre, apellido)
+            vendedor.edad = edad
+            registros.append(vendedor)
+        return registros
+
+    def columnar():
+        tabla = TablaVendedores()
+        tabla.nombres.extend(nombres)
+        tabla.apellidos.extend(apellidos)
+        tabla.edades.extend(edades)
+        return tabla
+
+    for nombre, construir in (("__dict__", con_dict), ("__slots__", con_slots), ("columnas", columnar)):
+        usado, _ = _medir(construir)
+        print(f"{nombre:>10}: {usado / n:7.1f} bytes/registro")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
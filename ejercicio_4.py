@@ -1,105 +1,24 @@
 import tkinter as tk
 from tkinter import messagebox
-import re # Módulo para expresiones regulares, usado en la validación
+import sqlite3
+import sys
+
+from nucleo import maraton
+from nucleo.instrumentacion import instrumentar
+# Las clases del modelo viven en nucleo.maraton (sin tkinter); se reexportan aquí por compatibilidad
+from nucleo.maraton import (
+    AlmacenEquipos,
+    EquipoMaratonProgramacion,
+    ErrorCampoContieneDigitos,
+    ErrorCampoInvalido,
+    ErrorCampoLongitudExcedida,
+    ErrorEquipoLleno,
+    ImportadorEquipos,
+    Programador,
+)
 
 # ==============================================================================
-# 1. Clases de Excepción Personalizadas
-# ==============================================================================
-
-class ErrorEquipoLleno(Exception):
-    """Excepción generada cuando se intenta añadir un programador a un equipo lleno."""
-    pass
-
-class ErrorCampoInvalido(Exception):
-    """Excepción base para errores de validación de campos (nombre/apellido)."""
-    pass
-
-class ErrorCampoContieneDigitos(ErrorCampoInvalido):
-    """Excepción generada cuando un campo contiene dígitos."""
-    pass
-
-class ErrorCampoLongitudExcedida(ErrorCampoInvalido):
-    """Excepción generada cuando la longitud de un campo es >= 20 caracteres."""
-    pass
-
-# ==============================================================================
-# 2. Clases de Modelo
-# ==============================================================================
-
-class Programador:
-    """Modela un integrante de un equipo de programadores. Posee nombre y apellidos."""
-    def __init__(self, nombre: str, apellidos: str):
-        self.nombre = nombre
-        self.apellidos = apellidos
-
-    def __str__(self):
-        return f"{self.nombre} {self.apellidos}"
-
-class EquipoMaratonProgramacion:
-    """Modela un equipo de programadores para una maratón."""
-    
-    # El equipo está conformado por varios programadores, mínimo dos y máximo tres.
-    MIN_PROGRAMADORES = 2
-    MAX_PROGRAMADORES = 3
-
-    def __init__(self, nombreEquipo: str, universidad: str, lenguajeProgramacion: str):
-        """
-        Constructor que inicializa los atributos del equipo.
-        El array de programadores se inicializa con capacidad máxima.
-        """
-        self.nombreEquipo = nombreEquipo
-        self.universidad = universidad
-        self.lenguajeProgramacion = lenguajeProgramacion
-        # Inicializa una lista (equivalente al array) con capacidad para MAX_PROGRAMADORES
-        self.programadores: list[Programador] = []
-        self.tamañoEquipo = 0 # El tamaño del equipo inicialmente es cero
-
-    def está_lleno(self) -> bool:
-        """Determina si el equipo ha alcanzado el número máximo de programadores (3)."""
-        return self.tamañoEquipo == self.MAX_PROGRAMADORES
-
-    def está_completo(self) -> bool:
-        """Determina si el equipo tiene el número mínimo (2) o máximo (3) de programadores."""
-        return self.tamañoEquipo >= self.MIN_PROGRAMADORES
-
-    def añadir(self, programador: Programador):
-        """
-        Añade un programador al equipo.
-        :param programador: El objeto Programador a agregar.
-        :raises ErrorEquipoLleno: Si el equipo ya tiene 3 programadores.
-        """
-        if self.está_lleno():
-            raise ErrorEquipoLleno("El equipo está completo (3/3). No se pudo agregar programador.")
-        
-        # Se añade el programador a la lista
-        self.programadores.append(programador)
-        self.tamañoEquipo += 1
-    
-    @staticmethod
-    def validar_campo(campo: str):
-        """
-        Valida que el campo:
-        1. Solo contenga texto (no dígitos).
-        2. Tenga una longitud estrictamente menor a 20 caracteres.
-        :param campo: El string (nombre o apellido) a validar.
-        :raises ErrorCampoContieneDigitos: Si el campo tiene dígitos.
-        :raises ErrorCampoLongitudExcedida: Si la longitud es >= 20.
-        """
-        if not campo.strip(): # Verifica si el campo está vacío o solo tiene espacios
-            # Se puede lanzar una excepción de campo vacío si se desea, pero el requerimiento es sobre dígitos y longitud
-            return 
-
-        # 1. Validar que no contenga dígitos (usando expresión regular)
-        if re.search(r'\d', campo):
-            raise ErrorCampoContieneDigitos(f"El campo '{campo}' no puede tener dígitos.")
-
-        # 2. Validar longitud (no se permiten >= 20)
-        if len(campo) >= 20:
-            raise ErrorCampoLongitudExcedida(f"La longitud de '{campo}' ({len(campo)} caracteres) no debe ser superior a 20.")
-
-
-# ==============================================================================
-# 3. Clase de Interfaz Gráfica (Tkinter)
+# Clase de Interfaz Gráfica (Tkinter)
 # ==============================================================================
 
 class AppMaraton(tk.Tk):
@@ -111,6 +30,8 @@ class AppMaraton(tk.Tk):
         
         # Objeto para el equipo
         self.equipo: EquipoMaratonProgramacion = None
+        # Identificador del after_idle pendiente; agrupa varios avisos en un solo redibujado
+        self._actualizacion_pendiente = None
         
         self.crear_widgets()
         self.mostrar_paso_1()
@@ -153,7 +74,8 @@ class AppMaraton(tk.Tk):
         tk.Label(self.frame_paso2, text="Apellidos del Programador:").pack(anchor='w', pady=(5, 0))
         tk.Entry(self.frame_paso2, textvariable=self.var_apellidos_prog, width=50).pack()
         
-        tk.Button(self.frame_paso2, text="Añadir Programador", command=self.añadir_programador).pack(pady=20)
+        self.btn_añadir = tk.Button(self.frame_paso2, text="Añadir Programador", command=self.añadir_programador)
+        self.btn_añadir.pack(pady=20)
         tk.Button(self.frame_paso2, text="Finalizar Registro (Mínimo 2)", command=self.finalizar_registro, bg='lightcoral').pack(pady=5)
         
         self.lbl_estado_equipo = tk.Label(self.frame_paso2, text="Programadores actuales: 0", fg='blue')
@@ -171,6 +93,7 @@ class AppMaraton(tk.Tk):
         self.frame_paso2.pack(expand=True, fill='both')
         self.actualizar_estado_programadores()
 
+    @instrumentar
     def crear_equipo(self):
         """
         Crea el objeto EquipoMaratonProgramacion con los datos ingresados.
@@ -187,13 +110,24 @@ class AppMaraton(tk.Tk):
             # Aunque el requisito no pide validación para estos campos, 
             # se podría añadir (e.g., que no estén vacíos)
             self.equipo = EquipoMaratonProgramacion(nombre, universidad, lenguaje)
+            self.equipo.suscribir(self.programar_actualizacion)
             messagebox.showinfo("Éxito", f"Equipo '{nombre}' creado. ¡Añade los programadores!")
             self.mostrar_paso_2()
         except Exception as e:
             messagebox.showerror("Error al Crear Equipo", str(e))
 
+    def programar_actualizacion(self, equipo: EquipoMaratonProgramacion):
+        """
+        Observador del equipo: programa una única actualización de la GUI para la próxima
+        vuelta del bucle de eventos, aunque lleguen varios avisos seguidos.
+        """
+        if self._actualizacion_pendiente is None:
+            self._actualizacion_pendiente = self.after_idle(self.actualizar_estado_programadores)
+
+    @instrumentar
     def actualizar_estado_programadores(self):
         """Actualiza el texto del estado de los programadores en la GUI."""
+        self._actualizacion_pendiente = None
         if self.equipo:
             self.lbl_estado_equipo.config(text=f"Programadores actuales: {self.equipo.tamañoEquipo}")
             self.lbl_paso2_titulo.config(text=f"Añadir Programador ({self.equipo.tamañoEquipo + 1}/{self.equipo.MAX_PROGRAMADORES})")
@@ -201,18 +135,12 @@ class AppMaraton(tk.Tk):
         # Deshabilita el botón de añadir si el equipo está lleno
         if self.equipo and self.equipo.está_lleno():
             self.lbl_paso2_titulo.config(text="Equipo Completo (3/3)", fg='red')
-            # Busca el botón "Añadir Programador" y lo deshabilita
-            for widget in self.frame_paso2.winfo_children():
-                if isinstance(widget, tk.Button) and widget.cget('text') == "Añadir Programador":
-                    widget.config(state=tk.DISABLED)
-                    break
+            self.btn_añadir.config(state=tk.DISABLED)
         else:
             # Habilita el botón si no está lleno
-            for widget in self.frame_paso2.winfo_children():
-                if isinstance(widget, tk.Button) and widget.cget('text') == "Añadir Programador":
-                    widget.config(state=tk.NORMAL)
-                    break
+            self.btn_añadir.config(state=tk.NORMAL)
     
+    @instrumentar
     def añadir_programador(self):
         """
         Valida y añade un programador al equipo.
@@ -224,30 +152,25 @@ class AppMaraton(tk.Tk):
             messagebox.showwarning("Advertencia", "El nombre y los apellidos del programador son obligatorios.")
             return
 
-        try:
-            # 1. Validar nombre y apellidos
-            EquipoMaratonProgramacion.validar_campo(nombre_prog)
-            EquipoMaratonProgramacion.validar_campo(apellidos_prog)
-            
-            # 2. Crear y añadir el programador
-            programador = Programador(nombre_prog, apellidos_prog)
-            self.equipo.añadir(programador)
-            
-            # 3. Éxito y limpieza
-            messagebox.showinfo("Éxito", f"Programador {nombre_prog} añadido al equipo.")
-            self.var_nombre_prog.set("") # Limpiar campos
-            self.var_apellidos_prog.set("")
-            self.actualizar_estado_programadores() # Actualizar contador en la GUI
-            
-        except ErrorEquipoLleno as e:
-            messagebox.showerror("Error de Capacidad", str(e))
-        except ErrorCampoContieneDigitos as e:
-            messagebox.showerror("Error de Validación", str(e))
-        except ErrorCampoLongitudExcedida as e:
-            messagebox.showerror("Error de Validación", str(e))
-        except Exception as e:
-            messagebox.showerror("Error Desconocido", f"Ocurrió un error inesperado: {str(e)}")
+        # 1. Validar nombre y apellidos; los errores llegan como códigos y solo aquí se convierten en mensajes
+        for campo in (nombre_prog, apellidos_prog):
+            codigo = EquipoMaratonProgramacion.codigo_campo(campo)
+            if codigo != EquipoMaratonProgramacion.CAMPO_VALIDO:
+                messagebox.showerror("Error de Validación", EquipoMaratonProgramacion.mensaje_campo(campo, codigo))
+                return
+
+        # 2. Crear y añadir el programador
+        if not self.equipo.añadir_si_cabe(Programador(nombre_prog, apellidos_prog)):
+            messagebox.showerror("Error de Capacidad", EquipoMaratonProgramacion.MENSAJE_EQUIPO_LLENO)
+            return
+
+        # 3. Éxito y limpieza
+        messagebox.showinfo("Éxito", f"Programador {nombre_prog} añadido al equipo.")
+        self.var_nombre_prog.set("") # Limpiar campos
+        self.var_apellidos_prog.set("")
+        # El contador de la GUI se actualiza con el aviso que emite el equipo al añadir
 
+    @instrumentar
     def finalizar_registro(self):
         """
         Verifica el tamaño mínimo del equipo y finaliza el registro.
@@ -259,6 +182,14 @@ class AppMaraton(tk.Tk):
         if self.equipo.tamañoEquipo < self.equipo.MIN_PROGRAMADORES:
             messagebox.showwarning("Advertencia", f"El equipo debe tener un mínimo de {self.equipo.MIN_PROGRAMADORES} programadores. Actualmente tiene {self.equipo.tamañoEquipo}.")
             return
+
+        # Guarda el equipo para que no se pierda al cerrar la aplicación
+        try:
+            with AlmacenEquipos() as almacen:
+                almacen.guardar(self.equipo)
+        except sqlite3.Error as e:
+            messagebox.showerror("Error al Guardar", f"No se pudo guardar el equipo: {str(e)}")
+            return
         
         # Registro exitoso, muestra la información final del equipo
         integrantes = "\n".join([f"- {p.nombre} {p.apellidos}" for p in self.equipo.programadores])
@@ -276,5 +207,9 @@ class AppMaraton(tk.Tk):
 
 # --- Ejecución del programa principal ---
 if __name__ == "__main__":
-    app = AppMaraton()
-    app.mainloop()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        # Importación masiva sin ventana; `python -m nucleo.maraton` hace lo mismo sin cargar tkinter
+        maraton.main()
+    else:
+        app = AppMaraton()
+        app.mainloop()
\ No newline at end of file
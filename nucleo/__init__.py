@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""
+Núcleo sin interfaz gráfica de los ejercicios de la Actividad 4.
+
+Los módulos de este paquete no importan tkinter al cargarse, de modo que pueden
+usarse desde procesos de trabajo, servidores o tareas por lotes. Los scripts de
+cada ejercicio contienen solo la interfaz gráfica y reexportan estas clases.
+Las dependencias que solo usa la línea de comandos (argparse, multiprocesos)
+se importan dentro de las funciones que las necesitan.
+"""
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Lectura de archivos de texto sin dependencias de GUI: lectura completa o en
+streaming, acceso por mmap con índice de líneas y carga en segundo plano.
+"""
+
+from array import array
+import mmap
+import os
+import queue
+import threading
+
+from nucleo.instrumentacion import instrumentar
+
+
+class LeerArchivo:
+    # Tamaño por defecto de cada bloque leído en modo streaming (64 KiB)
+    TAMAÑO_BLOQUE = 64 * 1024
+
+    @staticmethod
+    def _verificar_ruta(ruta):
+        if not os.path.exists(ruta):
+            raise FileNotFoundError("El archivo no existe.")
+
+    @staticmethod
+    def iterar_lineas(ruta, mayusculas=False):
+        # Genera las líneas una a una; la memoria usada no depende del tamaño del archivo
+        LeerArchivo._verificar_ruta(ruta)
+        return LeerArchivo._generar_lineas(ruta, mayusculas)
+
+    @staticmethod
+    def _generar_lineas(ruta, mayusculas):
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            if mayusculas:
+                for linea in archivo:
+                    yield linea.upper()
+            else:
+                yield from archivo
+
+    @staticmethod
+    def iterar_bloques(ruta, tamaño=TAMAÑO_BLOQUE, mayusculas=False):
+        # Genera bloques de como máximo `tamaño` caracteres, transformando cada bloque completo
+        LeerArchivo._verificar_ruta(ruta)
+        return LeerArchivo._generar_bloques(ruta, tamaño, mayusculas)
+
+    @staticmethod
+    def _generar_bloques(ruta, tamaño, mayusculas):
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            while True:
+                bloque = archivo.read(tamaño)
+                if not bloque:
+                    break
+                yield bloque.upper() if mayusculas else bloque
+
+    @staticmethod
+    @instrumentar
+    def leer_archivo(ruta):
+        return list(LeerArchivo.iterar_lineas(ruta))
+
+    @staticmethod
+    def leer_en_mayusculas(ruta):
+        return list(LeerArchivo.iterar_lineas(ruta, mayusculas=True))
+
+class LeerArchivoMapeado:
+    # Lector sobre mmap: expone rangos de bytes sin copiarlos y solo decodifica lo pedido.
+    # Las vistas devueltas por bytes_rango deben liberarse antes de llamar a cerrar().
+    LINEAS_POR_LOTE = 65536
+
+    def __init__(self, ruta):
+        LeerArchivo._verificar_ruta(ruta)
+        self.ruta = ruta
+        self._archivo = open(ruta, "rb")
+        self.tamaño = os.fstat(self._archivo.fileno()).st_size
+        # mmap no admite archivos vacíos; en ese caso se usa un búfer vacío
+        if self.tamaño:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._mapa = b""
+        self._vista = memoryview(self._mapa)
+        # Desplazamiento de inicio de cada línea más el final de la última línea indexada
+        self.indice = array("Q", [0])
+        self.indexado = self.tamaño == 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        # Puede llamarse más de una vez. Si quedan vistas de bytes_rango sin liberar, el mmap
+        # no puede cerrarse aún y se propaga el BufferError, pero el archivo se cierra igual y
+        # el lector suelta el mapa, que se libera junto con la última vista
+        if self._archivo.closed:
+            return
+        vista, mapa = self._vista, self._mapa
+        self._vista, self._mapa = memoryview(b""), b""
+        try:
+            vista.release()
+        finally:
+            try:
+                if isinstance(mapa, mmap.mmap):
+                    mapa.close()
+            finally:
+                self._archivo.close()
+
+    def bytes_rango(self, inicio, fin):
+        # Devuelve una vista (sin copia) de los bytes [inicio, fin)
+        return self._vista[inicio:fin]
+
+    def indexar_lotes(self, lineas_por_lote=LINEAS_POR_LOTE):
+        # Construye el índice de líneas de forma incremental; genera los bytes recorridos
+        # tras cada lote para poder informar progreso o detenerse entre lotes
+        mapa = self._mapa
+        indice = self.indice
+        tamaño = self.tamaño
+        posicion = indice[-1]
+        pendientes = lineas_por_lote
+        while posicion < tamaño:
+            fin = mapa.find(b"\n", posicion)
+            posicion = tamaño if fin < 0 else fin + 1
+            indice.append(posicion)
+            pendientes -= 1
+            if not pendientes:
+                pendientes = lineas_por_lote
+                yield posicion
+        self.indexado = True
+        yield posicion
+
+    @instrumentar
+    def construir_indice(self):
+        for _ in self.indexar_lotes():
+            pass
+        return self.indice
+
+    @property
+    def lineas_disponibles(self):
+        return len(self.indice) - 1
+
+    def rango_lineas(self, inicio, fin):
+        # Desplazamientos en bytes de las líneas [inicio, fin); O(1) una vez indexadas
+        fin = min(fin, self.lineas_disponibles)
+        inicio = min(inicio, fin)
+        return self.indice[inicio], self.indice[fin]
+
+    @instrumentar
+    def decodificar(self, inicio, fin, mayusculas=False):
+        # Decodifica solo el rango de bytes pedido y, si se solicita, lo pasa a mayúsculas de una vez.
+        # Los bytes que no son UTF-8 válido se muestran como U+FFFD: el visor llama a este método
+        # en cada desplazamiento y un byte dañado no debe dejar el archivo sin poder leerse
+        texto = str(self._vista[inicio:fin], "utf-8", "replace").replace("\r\n", "\n")
+        return texto.upper() if mayusculas else texto
+
+    def lineas(self, inicio, fin, mayusculas=False):
+        # Texto de las líneas [inicio, fin) como un único str
+        return self.decodificar(*self.rango_lineas(inicio, fin), mayusculas)
+
+    def linea(self, numero, mayusculas=False):
+        if not 0 <= numero < self.lineas_disponibles:
+            raise IndexError("Número de línea fuera de rango.")
+        return self.lineas(numero, numero + 1, mayusculas)
+
+
+class CargadorArchivo:
+    # Indexa un LeerArchivoMapeado en un hilo de trabajo y publica cada lote en una cola
+    # que la GUI vacía con root.after; la carga puede cancelarse entre lotes
+    LINEAS_POR_LOTE = 16384
+
+    def __init__(self, fuente):
+        self.fuente = fuente
+        self.cola = queue.Queue()
+        self._cancelado = threading.Event()
+        self._hilo = threading.Thread(target=self._trabajar, daemon=True)
+
+    def iniciar(self):
+        self._hilo.start()
+
+    def cancelar(self):
+        self._cancelado.set()
+        self._hilo.join()
+
+    @instrumentar
+    def _trabajar(self):
+        try:
+            for bytes_leidos in self.fuente.indexar_lotes(self.LINEAS_POR_LOTE):
+                if self._cancelado.is_set():
+                    self.cola.put(("cancelado", bytes_leidos))
+                    return
+                self.cola.put(("lote", bytes_leidos))
+            self.cola.put(("fin", self.fuente.tamaño))
+        except Exception as e:
+            self.cola.put(("error", e))
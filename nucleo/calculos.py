@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de cálculos numéricos (logaritmo neperiano y raíz cuadrada) sin dependencias de GUI.
+
+Los errores se devuelven como objetos Resultado o como códigos por elemento,
+nunca como diálogos. Uso por lotes desde la línea de comandos:
+
+    python -m nucleo.calculos entrada.csv salida.csv --procesos 4
+"""
+
+import csv
+import functools
+import math
+import os
+import sys
+from array import array
+from collections import deque
+from itertools import islice
+from typing import NamedTuple, Optional
+
+from nucleo.instrumentacion import instrumentar
+from nucleo.lotes import convertir_lote, numpy
+
+
+class Resultado(NamedTuple):
+    """Resultado de un cálculo escalar: el valor o un código y mensaje de error."""
+    valor: Optional[float]
+    codigo: int = 0
+    mensaje: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.codigo == MotorCalculos.SIN_ERROR
+
+
+class MotorCalculos:
+
+    # Códigos de error devueltos por los cálculos escalares y por lotes
+    SIN_ERROR = 0
+    ERROR_NEGATIVO = 1
+    ERROR_NO_NUMERICO = 2
+    ERROR_CERO = 3  # El logaritmo de cero no está definido
+
+    # Operaciones escalares: (descripción para los mensajes, función, ¿el cero es inválido?)
+    LOGARITMO = ("el logaritmo", math.log, True)
+    RAIZ = ("la raíz cuadrada", math.sqrt, False)
+
+    @staticmethod
+    def logaritmoNeperiano(valor) -> Resultado:
+        return MotorCalculos._calcular(valor, MotorCalculos.LOGARITMO)
+
+    @staticmethod
+    def raizCuadrada(valor) -> Resultado:
+        return MotorCalculos._calcular(valor, MotorCalculos.RAIZ)
+
+    @staticmethod
+    @instrumentar
+    def calcularAmbos(valor) -> tuple[Resultado, Resultado]:
+        """
+        Interpreta y valida el valor una sola vez y devuelve (logaritmo, raíz).
+        Los resultados se memorizan en una caché LRU indexada por el número ya convertido.
+        """
+        numero = MotorCalculos._convertir(valor)
+        if numero is None:
+            return (MotorCalculos._errorNoNumerico(MotorCalculos.LOGARITMO),
+                    MotorCalculos._errorNoNumerico(MotorCalculos.RAIZ))
+        return MotorCalculos._calcularAmbosEnCache(numero)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _calcularAmbosEnCache(numero):
+        return (MotorCalculos._evaluar(numero, MotorCalculos.LOGARITMO),
+                MotorCalculos._evaluar(numero, MotorCalculos.RAIZ))
+
+    @staticmethod
+    def estadisticasCache():
+        # Aciertos, fallos, tamaño máximo y tamaño actual de la caché de calcularAmbos
+        return MotorCalculos._calcularAmbosEnCache.cache_info()
+
+    @staticmethod
+    def limpiarCache():
+        MotorCalculos._calcularAmbosEnCache.cache_clear()
+
+    @staticmethod
+    def _convertir(valor):
+        try:
+            return float(valor)
+        except (ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _calcular(valor, operacion):
+        numero = MotorCalculos._convertir(valor)
+        if numero is None:
+            return MotorCalculos._errorNoNumerico(operacion)
+        return MotorCalculos._evaluar(numero, operacion)
+
+    @staticmethod
+    def _errorNoNumerico(operacion):
+        return Resultado(None, MotorCalculos.ERROR_NO_NUMERICO,
+                         f"El valor debe ser numérico para calcular {operacion[0]}")
+
+    @staticmethod
+    def _evaluar(numero, operacion):
+        descripcion, funcion, cero_invalido = operacion
+        if numero < 0:
+            return Resultado(None, MotorCalculos.ERROR_NEGATIVO,
+                             f"El valor debe ser un número positivo para calcular {descripcion}")
+        if cero_invalido and numero == 0:
+            return Resultado(None, MotorCalculos.ERROR_CERO,
+                             f"El valor debe ser un número positivo para calcular {descripcion}")
+        return Resultado(funcion(numero))
+
+    @staticmethod
+    def calcularLogaritmosNeperianos(valores):
+        # Devuelve (resultados, errores): NaN y un código de error en cada posición inválida
+        return MotorCalculos._calcularLote(valores, "log", math.log, cero_invalido=True)
+
+    @staticmethod
+    def calcularRaicesCuadradas(valores):
+        return MotorCalculos._calcularLote(valores, "sqrt", math.sqrt, cero_invalido=False)
+
+    @staticmethod
+    @instrumentar
+    def _calcularLote(valores, nombre_numpy, funcion, cero_invalido):
+        numeros, no_numericos = convertir_lote(valores)
+
+        np = numpy()
+        if np is not None:
+            errores = np.zeros(numeros.size, dtype=np.uint8)
+            if cero_invalido:
+                errores[numeros == 0] = MotorCalculos.ERROR_CERO
+            errores[numeros < 0] = MotorCalculos.ERROR_NEGATIVO
+            errores[no_numericos] = MotorCalculos.ERROR_NO_NUMERICO
+            with np.errstate(divide="ignore", invalid="ignore"):
+                resultados = getattr(np, nombre_numpy)(numeros)
+            resultados[errores != 0] = np.nan
+            return resultados, errores
+
+        resultados = array("d", bytes(8 * len(numeros)))
+        errores = array("B", bytes(len(numeros)))
+        for i, valor in enumerate(numeros):
+            if no_numericos[i]:
+                errores[i] = MotorCalculos.ERROR_NO_NUMERICO
+            elif valor < 0:
+                errores[i] = MotorCalculos.ERROR_NEGATIVO
+            elif cero_invalido and valor == 0:
+                errores[i] = MotorCalculos.ERROR_CERO
+            else:
+                resultados[i] = funcion(valor)
+                continue
+            resultados[i] = math.nan
+        return resultados, errores
+
+
+# ==============================================================================
+# Procesamiento de archivos en paralelo
+# ==============================================================================
+
+def _procesar_bloque(valores):
+    # Se ejecuta en un proceso de trabajo; devuelve listas para que el envío sea barato
+    logaritmos, errores_log = MotorCalculos.calcularLogaritmosNeperianos(valores)
+    raices, errores_raiz = MotorCalculos.calcularRaicesCuadradas(valores)
+    return valores, logaritmos.tolist(), raices.tolist(), errores_log.tolist(), errores_raiz.tolist()
+
+
+def _leer_bloques(archivo, columna, tamaño_bloque):
+    filas = csv.reader(archivo)
+    while True:
+        bloque = [fila[columna] if len(fila) > columna else "" for fila in islice(filas, tamaño_bloque)]
+        if not bloque:
+            return
+        yield bloque
+
+
+@instrumentar
+def procesar_archivo(entrada, salida, columna=0, procesos=None, tamaño_bloque=100_000, encabezado=False):
+    """
+    Calcula logaritmo y raíz de una columna de un CSV repartiendo los bloques entre procesos.
+    Solo se mantienen en memoria unos pocos bloques a la vez y el orden de salida se conserva.
+    :return: Número de filas procesadas.
+    """
+    from concurrent.futures import ProcessPoolExecutor  # Costoso de importar; solo hace falta aquí
+
+    filas = 0
+    with open(entrada, newline="", encoding="utf-8") as archivo_entrada, \
+            open(salida, "w", newline="", encoding="utf-8") as archivo_salida, \
+            ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        if encabezado:
+            next(archivo_entrada, None)
+        escritor = csv.writer(archivo_salida)
+        escritor.writerow(["valor", "logaritmo", "raiz", "error_logaritmo", "error_raiz"])
+
+        en_curso = deque()
+        limite = 2 * (procesos or os.cpu_count() or 1)
+        for bloque in _leer_bloques(archivo_entrada, columna, tamaño_bloque):
+            en_curso.append(ejecutor.submit(_procesar_bloque, bloque))
+            if len(en_curso) >= limite:
+                filas += _escribir_bloque(escritor, en_curso.popleft().result())
+        while en_curso:
+            filas += _escribir_bloque(escritor, en_curso.popleft().result())
+    return filas
+
+
+def _escribir_bloque(escritor, bloque):
+    valores, logaritmos, raices, errores_log, errores_raiz = bloque
+    escritor.writerows(
+        (valor, "" if e_log else log, "" if e_raiz else raiz, e_log, e_raiz)
+        for valor, log, raiz, e_log, e_raiz in zip(valores, logaritmos, raices, errores_log, errores_raiz)
+    )
+    return len(valores)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Logaritmo neperiano y raíz cuadrada por lotes.")
+    parser.add_argument("entrada", help="CSV con los valores a calcular")
+    parser.add_argument("salida", help="CSV donde se escriben los resultados")
+    parser.add_argument("--columna", type=int, default=0, help="Índice de la columna con los valores")
+    parser.add_argument("--procesos", type=int, default=None, help="Número de procesos de trabajo")
+    parser.add_argument("--bloque", type=int, default=100_000, help="Filas por bloque")
+    parser.add_argument("--encabezado", action="store_true", help="Omite la primera fila de la entrada")
+    args = parser.parse_args(argv)
+    filas = procesar_archivo(args.entrada, args.salida, args.columna, args.procesos, args.bloque, args.encabezado)
+    print(f"{filas} filas procesadas", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+División con manejo de excepciones, escalar y por lotes, sin dependencias de GUI.
+
+Uso por lotes desde la línea de comandos:
+
+    python -m nucleo.division --csv entrada.csv --salida resultados.csv
+"""
+
+import csv
+import math
+import sys
+import time
+from array import array
+from itertools import islice
+
+from nucleo.instrumentacion import instrumentar
+from nucleo.lotes import convertir_lote, numpy
+
+
+class PruebaExcepciones:
+    # Códigos de estado por fila devueltos por dividirLote
+    ESTADO_OK = 0
+    ESTADO_DIVISION_CERO = 1
+    ESTADO_INVALIDO = 2
+
+    # Mensajes mostrados por dividir para cada estado de error
+    MENSAJES = {
+        ESTADO_DIVISION_CERO: "Error: No se puede dividir entre cero.",
+        ESTADO_INVALIDO: "Error: Ingreso inválido. Debe ingresar números.",
+    }
+
+    @staticmethod
+    @instrumentar
+    def dividirConEstado(a, b):
+        # Divide sin lanzar excepciones: devuelve (resultado, estado), con resultado None si hay error.
+        # Acepta números o textos; el divisor cero se detecta antes de dividir.
+        try:
+            a, b = float(a), float(b)
+        except (ValueError, TypeError):
+            return None, PruebaExcepciones.ESTADO_INVALIDO
+        if b == 0:
+            return None, PruebaExcepciones.ESTADO_DIVISION_CERO
+        return a / b, PruebaExcepciones.ESTADO_OK
+
+    @staticmethod
+    def dividir(a, b):
+        # El divisor cero se comprueba antes para no pagar el coste de una excepción
+        if b == 0:
+            return PruebaExcepciones.MENSAJES[PruebaExcepciones.ESTADO_DIVISION_CERO]
+        try:
+            resultado = a / b
+            return f"Resultado: {resultado}"
+        except ZeroDivisionError:
+            return PruebaExcepciones.MENSAJES[PruebaExcepciones.ESTADO_DIVISION_CERO]
+        except ValueError:
+            return PruebaExcepciones.MENSAJES[PruebaExcepciones.ESTADO_INVALIDO]
+        except Exception as e:
+            return f"Error inesperado: {str(e)}"
+
+    @staticmethod
+    @instrumentar
+    def dividirLote(numeradores, denominadores):
+        # Divide dos columnas elemento a elemento; devuelve (resultados, estados).
+        # Las filas con estado distinto de ESTADO_OK quedan como NaN.
+        a, a_invalidos = convertir_lote(numeradores)
+        b, b_invalidos = convertir_lote(denominadores)
+        if len(a) != len(b):
+            raise ValueError("Los numeradores y denominadores deben tener la misma longitud.")
+
+        np = numpy()
+        if np is not None:
+            estados = np.zeros(a.size, dtype=np.uint8)
+            estados[b == 0] = PruebaExcepciones.ESTADO_DIVISION_CERO
+            estados[a_invalidos | b_invalidos] = PruebaExcepciones.ESTADO_INVALIDO
+            resultados = np.full(a.size, np.nan)
+            # Como en la ruta escalar, el desbordamiento da inf e inf/inf da NaN sin avisos
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                np.divide(a, b, out=resultados, where=estados == PruebaExcepciones.ESTADO_OK)
+            return resultados, estados
+
+        resultados = array("d", bytes(8 * len(a)))
+        estados = array("B", bytes(len(a)))
+        for i, (x, y) in enumerate(zip(a, b)):
+            if a_invalidos[i] or b_invalidos[i]:
+                estados[i] = PruebaExcepciones.ESTADO_INVALIDO
+            elif y == 0:
+                estados[i] = PruebaExcepciones.ESTADO_DIVISION_CERO
+            else:
+                resultados[i] = x / y
+                continue
+            resultados[i] = math.nan
+        return resultados, estados
+
+
+@instrumentar
+def dividir_csv(entrada, salida, tamaño_bloque=100_000, encabezado=False):
+    # Lee pares numerador,denominador de `entrada` por bloques y escribe cada bloque en `salida`
+    # en cuanto se calcula; la memoria usada depende solo del tamaño del bloque.
+    lector = csv.reader(entrada)
+    escritor = csv.writer(salida)
+    if encabezado:
+        next(lector, None)
+    escritor.writerow(["numerador", "denominador", "resultado", "estado"])
+
+    filas = 0
+    while True:
+        bloque = list(islice(lector, tamaño_bloque))
+        if not bloque:
+            return filas
+        numeradores = [fila[0] if len(fila) > 0 else "" for fila in bloque]
+        denominadores = [fila[1] if len(fila) > 1 else "" for fila in bloque]
+        resultados, estados = PruebaExcepciones.dividirLote(numeradores, denominadores)
+        escritor.writerows(
+            (a, b, "" if estado else resultado, estado)
+            for a, b, resultado, estado in zip(numeradores, denominadores, resultados.tolist(), estados.tolist())
+        )
+        filas += len(bloque)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Divisiones por lotes desde un CSV o la entrada estándar.")
+    parser.add_argument("--csv", metavar="RUTA", required=True, help="CSV con pares numerador,denominador ('-' para la entrada estándar)")
+    parser.add_argument("--salida", metavar="RUTA", default="-", help="CSV de resultados ('-' para la salida estándar)")
+    parser.add_argument("--bloque", type=int, default=100_000, help="Filas procesadas por bloque")
+    parser.add_argument("--encabezado", action="store_true", help="Omite la primera fila de la entrada")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    entrada = sys.stdin if args.csv == "-" else open(args.csv, newline="", encoding="utf-8")
+    salida = sys.stdout if args.salida == "-" else open(args.salida, "w", newline="", encoding="utf-8")
+    try:
+        filas = dividir_csv(entrada, salida, args.bloque, args.encabezado)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+    duracion = time.perf_counter() - inicio
+    print(f"{filas} filas en {duracion:.2f} s ({filas / duracion if duracion else 0:,.0f} filas/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
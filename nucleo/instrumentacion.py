@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Instrumentación opcional de funciones del núcleo y de callbacks de la GUI.
+
+Se activa con variables de entorno antes de arrancar el programa:
+
+    ACTIVIDAD4_PERFIL=1          llamadas e histograma de latencias por función
+    ACTIVIDAD4_PERFIL=memoria    además, asignaciones netas con tracemalloc (más lento)
+    ACTIVIDAD4_PERFIL_SALIDA     archivo JSON escrito al salir (perfil_actividad4.json)
+
+Desactivada, el decorador devuelve la función original y el gestor de contexto
+es un contexto nulo, así que el coste es prácticamente cero. Las latencias de un
+callback incluyen las de las funciones del núcleo que llama: la diferencia es el
+tiempo de Tk (y el de los diálogos modales abiertos durante el callback).
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+_modo = os.environ.get("ACTIVIDAD4_PERFIL", "").strip().lower()
+ACTIVO = _modo not in ("", "0", "no", "false")
+MEMORIA = ACTIVO and _modo == "memoria"
+RUTA_SALIDA = os.environ.get("ACTIVIDAD4_PERFIL_SALIDA", "perfil_actividad4.json")
+
+_estadisticas = {}
+_candado = threading.Lock()
+
+
+class _Estadistica:
+    __slots__ = ("llamadas", "total_ns", "maximo_ns", "histograma", "asignado_bytes", "maximo_asignado_bytes")
+
+    def __init__(self):
+        self.llamadas = 0
+        self.total_ns = 0
+        self.maximo_ns = 0
+        # histograma[k]: llamadas que duraron menos de 2**k microsegundos
+        self.histograma = []
+        self.asignado_bytes = 0
+        self.maximo_asignado_bytes = 0
+
+    def registrar(self, duracion_ns, asignado):
+        self.llamadas += 1
+        self.total_ns += duracion_ns
+        if duracion_ns > self.maximo_ns:
+            self.maximo_ns = duracion_ns
+        cubeta = (duracion_ns // 1000).bit_length()
+        try:
+            self.histograma[cubeta] += 1
+        except IndexError:
+            self.histograma.extend([0] * (cubeta + 1 - len(self.histograma)))
+            self.histograma[cubeta] += 1
+        if asignado:
+            self.asignado_bytes += asignado
+            if asignado > self.maximo_asignado_bytes:
+                self.maximo_asignado_bytes = asignado
+
+    def a_diccionario(self):
+        datos = {
+            "llamadas": self.llamadas,
+            "total_ms": self.total_ns / 1e6,
+            "media_us": self.total_ns / self.llamadas / 1e3,
+            "maximo_us": self.maximo_ns / 1e3,
+            "histograma_us": {f"<{2 ** k}": n for k, n in enumerate(self.histograma) if n},
+        }
+        if MEMORIA:
+            datos["asignado_neto_bytes"] = self.asignado_bytes
+            datos["maximo_asignado_neto_bytes"] = self.maximo_asignado_bytes
+        return datos
+
+
+def _estadistica(nombre):
+    # Solo la creación de la entrada usa el candado; el registro de cada llamada no lo toma
+    # para no encarecer las funciones rápidas, así que dos hilos que midan a la vez el mismo
+    # nombre pueden perder alguna llamada en los contadores.
+    with _candado:
+        estadistica = _estadisticas.get(nombre)
+        if estadistica is None:
+            estadistica = _estadisticas[nombre] = _Estadistica()
+        return estadistica
+
+
+@contextlib.contextmanager
+def _medicion(nombre):
+    memoria_inicial = tracemalloc.get_traced_memory()[0] if MEMORIA else 0
+    inicio = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        duracion = time.perf_counter_ns() - inicio
+        asignado = tracemalloc.get_traced_memory()[0] - memoria_inicial if MEMORIA else 0
+        _estadistica(nombre).registrar(duracion, asignado)
+
+
+def medir(nombre):
+    """
+    Gestor de contexto que mide un bloque de código bajo el nombre dado.
+    :param nombre: Clave con la que aparece en las estadísticas.
+    """
+    if not ACTIVO:
+        return contextlib.nullcontext()
+    return _medicion(nombre)
+
+
+def instrumentar(funcion=None, *, nombre=None):
+    """
+    Decorador que mide cada llamada a la función. Se usa como @instrumentar o
+    @instrumentar(nombre="..."). Si la instrumentación está desactivada devuelve la función tal cual.
+    En un generador solo mediría su creación; para esos casos se usa medir.
+    :param nombre: Clave en las estadísticas; por defecto, módulo y nombre calificado de la función.
+    """
+    if funcion is None:
+        return functools.partial(instrumentar, nombre=nombre)
+    if not ACTIVO:
+        return funcion
+    clave = nombre or f"{funcion.__module__}.{funcion.__qualname__}"
+
+    if MEMORIA:
+        @functools.wraps(funcion)
+        def envoltorio(*args, **kwargs):
+            with _medicion(clave):
+                return funcion(*args, **kwargs)
+        return envoltorio
+
+    # Sin tracemalloc se mide en línea, sin el coste de crear un gestor de contexto por llamada
+    reloj = time.perf_counter_ns
+    registrar = _estadistica(clave).registrar
+
+    @functools.wraps(funcion)
+    def envoltorio(*args, **kwargs):
+        inicio = reloj()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            registrar(reloj() - inicio, 0)
+    return envoltorio
+
+
+def estadisticas():
+    """:return: Diccionario {nombre: estadísticas} con lo registrado hasta ahora."""
+    with _candado:
+        return {nombre: e.a_diccionario() for nombre, e in sorted(_estadisticas.items()) if e.llamadas}
+
+
+def volcar(ruta=None):
+    """Escribe las estadísticas en un archivo JSON (por defecto, ACTIVIDAD4_PERFIL_SALIDA)."""
+    with open(ruta or RUTA_SALIDA, "w", encoding="utf-8") as archivo:
+        json.dump({"memoria": MEMORIA, "funciones": estadisticas()}, archivo, ensure_ascii=False, indent=2)
+
+
+if ACTIVO:
+    if MEMORIA:
+        import tracemalloc
+        tracemalloc.start()
+    atexit.register(volcar)
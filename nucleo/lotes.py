@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Utilidades compartidas para el procesamiento por lotes.
+
+NumPy es opcional: si no está instalado, las columnas se representan con el
+módulo array de la biblioteca estándar.
+"""
+
+import functools
+import math
+from array import array
+
+_MINIMO_ENTERO = -2 ** 63
+_MAXIMO_ENTERO = 2 ** 63 - 1
+
+
+@functools.lru_cache(maxsize=None)
+def numpy():
+    """Devuelve el módulo numpy, importándolo la primera vez que se necesita, o None si no existe."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def convertir_lote(valores, entero=False):
+    """
+    Convierte una secuencia de números o textos a float (o a int si `entero` es verdadero).
+    Con `entero`, los decimales se truncan hacia cero como hace int() (30.7 -> 30, -0.5 -> 0)
+    y NaN, infinito o cualquier valor fuera del rango de int64 cuentan como no numéricos,
+    igual con NumPy que sin él.
+    :return: (números, máscara de no numéricos). Los no numéricos quedan como NaN (o 0).
+    """
+    np = numpy()
+    if np is None:
+        numeros, invalidos = _convertir_valores(valores, entero)
+        no_numericos = array("B", bytes(len(numeros)))
+        for i in invalidos:
+            no_numericos[i] = True
+        return array("q" if entero else "d", numeros), no_numericos
+
+    dtype = np.int64 if entero else np.float64
+    # Solo los datos ya numéricos se convierten con astype. Los textos y las listas mixtas se
+    # interpretan una vez en Python, con las mismas reglas que sin NumPy: astype sobre textos
+    # es varias veces más lento que float() y un solo valor inválido obligaba a repetirlo todo.
+    if isinstance(valores, np.ndarray):
+        arreglo = valores.ravel()
+        valores = arreglo.tolist()
+    else:
+        if not isinstance(valores, (list, tuple)):
+            valores = list(valores)
+        arreglo = np.asarray(valores) if valores and not isinstance(valores[0], str) else None
+    if arreglo is not None and arreglo.dtype.kind in "biuf":
+        no_numericos = np.zeros(arreglo.size, dtype=bool)
+        if entero and arreglo.dtype.kind in "uf":
+            # astype(int64) convierte NaN, infinito y lo que no cabe en int64 en basura
+            # (INT64_MIN) sin avisar; se marcan antes y se rellenan con 0 como sin NumPy.
+            # El límite superior es 2.0 ** 63 porque 2 ** 63 - 1 no es representable en float64.
+            if arreglo.dtype.kind == "f":
+                no_numericos = ~np.isfinite(arreglo) | (arreglo < _MINIMO_ENTERO) | (arreglo >= 2.0 ** 63)
+            else:
+                no_numericos = arreglo > _MAXIMO_ENTERO
+            if no_numericos.any():
+                arreglo = np.where(no_numericos, 0, arreglo)
+        return arreglo.astype(dtype), no_numericos
+
+    tipo = int if entero else float
+    try:
+        # Caso habitual de un bloque sin inválidos: una comprensión, sin marcas por elemento
+        return np.array([tipo(valor) for valor in valores], dtype=dtype), np.zeros(len(valores), dtype=bool)
+    except (ValueError, TypeError, OverflowError):
+        numeros, invalidos = _convertir_valores(valores, entero)
+        no_numericos = np.zeros(len(numeros), dtype=bool)
+        no_numericos[invalidos] = True
+        return np.array(numeros, dtype=dtype), no_numericos
+
+
+def _convertir_valores(valores, entero):
+    # Devuelve los números (NaN o 0 en los inválidos) y las posiciones de los no numéricos
+    tipo, relleno = (int, 0) if entero else (float, math.nan)
+    errores = (ValueError, TypeError, OverflowError)
+    numeros = []
+    invalidos = []
+    agregar = numeros.append
+    for i, valor in enumerate(valores):
+        try:
+            agregar(tipo(valor))
+        except errores:
+            agregar(relleno)
+            invalidos.append(i)
+    if entero:
+        # Los enteros que no caben en 64 bits también cuentan como no numéricos
+        for i, numero in enumerate(numeros):
+            if not _MINIMO_ENTERO <= numero <= _MAXIMO_ENTERO:
+                numeros[i] = relleno
+                invalidos.append(i)
+    return numeros, invalidos
@@ -0,0 +1,528 @@
+# -*- coding: utf-8 -*-
+"""
+Modelo de la maratón de programación sin dependencias de GUI: excepciones,
+programadores, equipos, importación masiva y persistencia en SQLite.
+
+Importación desde la línea de comandos:
+
+    python -m nucleo.maraton --importar equipos.csv --almacen equipos_maraton.db
+"""
+
+import csv
+import json
+import re # Módulo para expresiones regulares, usado en la validación
+import sqlite3
+import sys
+import time
+from itertools import groupby, islice
+from typing import Optional
+
+from nucleo.instrumentacion import instrumentar
+
+# ==============================================================================
+# 1. Clases de Excepción Personalizadas
+# ==============================================================================
+
+class ErrorEquipoLleno(Exception):
+    """Excepción generada cuando se intenta añadir un programador a un equipo lleno."""
+    pass
+
+class ErrorCampoInvalido(Exception):
+    """Excepción base para errores de validación de campos (nombre/apellido)."""
+    pass
+
+class ErrorCampoContieneDigitos(ErrorCampoInvalido):
+    """Excepción generada cuando un campo contiene dígitos."""
+    pass
+
+class ErrorCampoLongitudExcedida(ErrorCampoInvalido):
+    """Excepción generada cuando la longitud de un campo es >= 20 caracteres."""
+    pass
+
+# ==============================================================================
+# 2. Clases de Modelo
+# ==============================================================================
+
+class Programador:
+    """Modela un integrante de un equipo de programadores. Posee nombre y apellidos."""
+    __slots__ = ("nombre", "apellidos") # Sin __dict__ por instancia
+
+    def __init__(self, nombre: str, apellidos: str):
+        self.nombre = nombre
+        self.apellidos = apellidos
+
+    def __str__(self):
+        return f"{self.nombre} {self.apellidos}"
+
+class EquipoMaratonProgramacion:
+    """Modela un equipo de programadores para una maratón."""
+
+    # Atributos fijos: sin __dict__ por instancia
+    __slots__ = ("nombreEquipo", "universidad", "lenguajeProgramacion", "programadores", "_observadores")
+    
+    # El equipo está conformado por varios programadores, mínimo dos y máximo tres.
+    MIN_PROGRAMADORES = 2
+    MAX_PROGRAMADORES = 3
+
+    # Códigos de error por campo devueltos por codigo_campo / validar_campos
+    CAMPO_VALIDO = 0
+    CAMPO_CONTIENE_DIGITOS = 1
+    CAMPO_LONGITUD_EXCEDIDA = 2
+    LONGITUD_MAXIMA = 20
+
+    MENSAJE_EQUIPO_LLENO = "El equipo está completo (3/3). No se pudo agregar programador."
+
+    # Patrón compilado una sola vez para todas las validaciones
+    _buscar_digito = re.compile(r'\d').search
+
+    def __init__(self, nombreEquipo: str, universidad: str, lenguajeProgramacion: str):
+        """
+        Constructor que inicializa los atributos del equipo.
+        Universidad y lenguaje se repiten entre muchos equipos, así que se internan
+        para compartir una sola copia de cada texto.
+        """
+        self.nombreEquipo = nombreEquipo
+        self.universidad = sys.intern(universidad)
+        self.lenguajeProgramacion = sys.intern(lenguajeProgramacion)
+        # Tupla inmutable de como máximo MAX_PROGRAMADORES; su longitud es el tamaño del equipo
+        self.programadores: tuple[Programador, ...] = ()
+        # Funciones a las que se avisa cuando cambia el tamaño del equipo
+        self._observadores = ()
+
+    @property
+    def tamañoEquipo(self) -> int:
+        """Número de programadores del equipo (inicialmente cero)."""
+        return len(self.programadores)
+
+    def suscribir(self, observador):
+        """
+        Registra una función que se llamará como observador(equipo) cada vez que cambie el tamaño del equipo.
+        :param observador: Función que recibe el equipo.
+        """
+        self._observadores += (observador,)
+
+    def desuscribir(self, observador):
+        """Deja de avisar a un observador registrado con suscribir."""
+        self._observadores = tuple(o for o in self._observadores if o != observador)
+
+    def está_lleno(self) -> bool:
+        """Determina si el equipo ha alcanzado el número máximo de programadores (3)."""
+        return self.tamañoEquipo == self.MAX_PROGRAMADORES
+
+    def está_completo(self) -> bool:
+        """Determina si el equipo tiene el número mínimo (2) o máximo (3) de programadores."""
+        return self.tamañoEquipo >= self.MIN_PROGRAMADORES
+
+    def añadir_si_cabe(self, programador: Programador) -> bool:
+        """
+        Añade un programador al equipo sin lanzar excepciones.
+        :param programador: El objeto Programador a agregar.
+        :return: True si se añadió, False si el equipo ya tenía 3 programadores.
+        """
+        if self.está_lleno():
+            return False
+
+        # Se añade el programador a la tupla y se avisa del nuevo tamaño
+        self.programadores += (programador,)
+        for observador in self._observadores:
+            observador(self)
+        return True
+
+    def añadir(self, programador: Programador):
+        """
+        Añade un programador al equipo.
+        :param programador: El objeto Programador a agregar.
+        :raises ErrorEquipoLleno: Si el equipo ya tiene 3 programadores.
+        """
+        if not self.añadir_si_cabe(programador):
+            raise ErrorEquipoLleno(self.MENSAJE_EQUIPO_LLENO)
+    
+    @staticmethod
+    def codigo_campo(campo: str) -> int:
+        """
+        Valida un campo sin lanzar excepciones (mismas reglas que validar_campo).
+        :param campo: El string (nombre o apellido) a validar.
+        :return: CAMPO_VALIDO, CAMPO_CONTIENE_DIGITOS o CAMPO_LONGITUD_EXCEDIDA.
+        """
+        if not campo.strip():
+            return EquipoMaratonProgramacion.CAMPO_VALIDO
+        if EquipoMaratonProgramacion._buscar_digito(campo):
+            return EquipoMaratonProgramacion.CAMPO_CONTIENE_DIGITOS
+        if len(campo) >= EquipoMaratonProgramacion.LONGITUD_MAXIMA:
+            return EquipoMaratonProgramacion.CAMPO_LONGITUD_EXCEDIDA
+        return EquipoMaratonProgramacion.CAMPO_VALIDO
+
+    @staticmethod
+    @instrumentar
+    def validar_campos(campos) -> list[int]:
+        """
+        Valida un lote de campos (nombres y apellidos) en una sola llamada.
+        :param campos: Iterable de strings a validar.
+        :return: Lista con el código de error de cada campo, en el mismo orden.
+        """
+        buscar_digito = EquipoMaratonProgramacion._buscar_digito
+        maxima = EquipoMaratonProgramacion.LONGITUD_MAXIMA
+        valido = EquipoMaratonProgramacion.CAMPO_VALIDO
+        digitos = EquipoMaratonProgramacion.CAMPO_CONTIENE_DIGITOS
+        longitud = EquipoMaratonProgramacion.CAMPO_LONGITUD_EXCEDIDA
+        return [
+            valido if not campo.strip()
+            else digitos if buscar_digito(campo)
+            else longitud if len(campo) >= maxima
+            else valido
+            for campo in campos
+        ]
+
+    @staticmethod
+    def validar_campo(campo: str):
+        """
+        Valida que el campo:
+        1. Solo contenga texto (no dígitos).
+        2. Tenga una longitud estrictamente menor a 20 caracteres.
+        Envoltorio de codigo_campo que conserva el comportamiento con excepciones.
+        :param campo: El string (nombre o apellido) a validar.
+        :raises ErrorCampoContieneDigitos: Si el campo tiene dígitos.
+        :raises ErrorCampoLongitudExcedida: Si la longitud es >= 20.
+        """
+        codigo = EquipoMaratonProgramacion.codigo_campo(campo)
+        if codigo == EquipoMaratonProgramacion.CAMPO_CONTIENE_DIGITOS:
+            raise ErrorCampoContieneDigitos(EquipoMaratonProgramacion.mensaje_campo(campo, codigo))
+        if codigo == EquipoMaratonProgramacion.CAMPO_LONGITUD_EXCEDIDA:
+            raise ErrorCampoLongitudExcedida(EquipoMaratonProgramacion.mensaje_campo(campo, codigo))
+
+    @staticmethod
+    def mensaje_campo(campo: str, codigo: int) -> Optional[str]:
+        """
+        Texto del error de un campo, para mostrarlo sin construir la excepción.
+        :param campo: El string validado.
+        :param codigo: El código devuelto por codigo_campo.
+        :return: El mensaje, o None si el campo es válido.
+        """
+        if codigo == EquipoMaratonProgramacion.CAMPO_CONTIENE_DIGITOS:
+            return f"El campo '{campo}' no puede tener dígitos."
+        if codigo == EquipoMaratonProgramacion.CAMPO_LONGITUD_EXCEDIDA:
+            return f"La longitud de '{campo}' ({len(campo)} caracteres) no debe ser superior a 20."
+        return None
+
+    def a_diccionario(self) -> dict:
+        """Representación del equipo apta para JSON."""
+        return {
+            "nombreEquipo": self.nombreEquipo,
+            "universidad": self.universidad,
+            "lenguajeProgramacion": self.lenguajeProgramacion,
+            "programadores": [{"nombre": p.nombre, "apellidos": p.apellidos} for p in self.programadores],
+        }
+
+
+# ==============================================================================
+# 3. Importación Masiva (sin interfaz gráfica)
+# ==============================================================================
+
+class ImportadorEquipos:
+    """
+    Importa equipos desde un archivo CSV o JSON Lines leyéndolo en streaming.
+
+    - CSV: encabezado nombreEquipo,universidad,lenguajeProgramacion,nombre,apellidos
+      y una fila por programador; las filas de un mismo equipo deben ser consecutivas.
+    - JSON Lines (.jsonl): un objeto por línea con el formato de a_diccionario().
+    - JSON (.json): un arreglo de esos objetos. Se carga completo en memoria; para
+      archivos grandes conviene JSON Lines.
+
+    Los equipos aceptados se escriben como JSON Lines y los rechazados en un CSV
+    (linea, nombreEquipo, motivo). Solo se mantiene en memoria un equipo a la vez.
+    """
+
+    COLUMNAS_EQUIPO = ("nombreEquipo", "universidad", "lenguajeProgramacion")
+
+    def __init__(self):
+        self.aceptados = 0
+        self.rechazados = 0
+        self.segundos = 0.0
+
+    @property
+    def equipos_por_segundo(self) -> float:
+        return (self.aceptados + self.rechazados) / self.segundos if self.segundos else 0.0
+
+    @instrumentar
+    def importar(self, ruta_entrada: str, ruta_aceptados: str, ruta_rechazos: str, almacen=None):
+        """
+        Procesa el archivo completo.
+        :param almacen: AlmacenEquipos opcional donde también se guardan los aceptados, por lotes.
+        :return: El propio importador, con los contadores y la duración actualizados.
+        """
+        inicio = time.perf_counter()
+        if ruta_entrada.endswith(".jsonl"):
+            lector = self._leer_json_lines
+        elif ruta_entrada.endswith(".json"):
+            lector = self._leer_json
+        else:
+            lector = self._leer_csv
+        with open(ruta_aceptados, "w", encoding="utf-8") as aceptados, \
+                open(ruta_rechazos, "w", newline="", encoding="utf-8") as rechazos:
+            escritor_rechazos = csv.writer(rechazos)
+            escritor_rechazos.writerow(["linea", "nombreEquipo", "motivo"])
+            pendientes = []
+            for linea, datos in lector(ruta_entrada):
+                equipo, motivo = self.construir_equipo(datos)
+                if equipo is None:
+                    self.rechazados += 1
+                    escritor_rechazos.writerow([linea, (datos or {}).get("nombreEquipo", ""), motivo])
+                    continue
+                self.aceptados += 1
+                aceptados.write(json.dumps(equipo.a_diccionario(), ensure_ascii=False) + "\n")
+                if almacen is not None:
+                    pendientes.append(equipo)
+                    if len(pendientes) >= AlmacenEquipos.EQUIPOS_POR_TRANSACCION:
+                        almacen.guardar_varios(pendientes)
+                        pendientes = []
+            if pendientes:
+                almacen.guardar_varios(pendientes)
+        self.segundos = time.perf_counter() - inicio
+        return self
+
+    @staticmethod
+    @instrumentar
+    def construir_equipo(datos):
+        """
+        Aplica las mismas reglas que la GUI y construye el equipo si son válidos.
+        :return: (equipo, None) si se acepta o (None, motivo) si se rechaza.
+        """
+        if datos is None:
+            return None, "formato_invalido"
+        campos_equipo = [ImportadorEquipos._texto(datos.get(columna)) for columna in ImportadorEquipos.COLUMNAS_EQUIPO]
+        programadores = datos.get("programadores") or []
+        if None in campos_equipo or not isinstance(programadores, list) \
+                or not all(isinstance(programador, dict) for programador in programadores):
+            return None, "formato_invalido"
+        if not all(campos_equipo):
+            return None, "campos_equipo_vacios"
+
+        if len(programadores) > EquipoMaratonProgramacion.MAX_PROGRAMADORES:
+            return None, "equipo_lleno"
+        if len(programadores) < EquipoMaratonProgramacion.MIN_PROGRAMADORES:
+            return None, "equipo_incompleto"
+
+        campos = []
+        for programador in programadores:
+            campos.append(ImportadorEquipos._texto(programador.get("nombre")))
+            campos.append(ImportadorEquipos._texto(programador.get("apellidos")))
+        if None in campos:
+            return None, "formato_invalido"
+        if not all(campos):
+            return None, "campos_programador_vacios"
+        for codigo in EquipoMaratonProgramacion.validar_campos(campos):
+            if codigo == EquipoMaratonProgramacion.CAMPO_CONTIENE_DIGITOS:
+                return None, "campo_con_digitos"
+            if codigo == EquipoMaratonProgramacion.CAMPO_LONGITUD_EXCEDIDA:
+                return None, "campo_longitud_excedida"
+
+        equipo = EquipoMaratonProgramacion(*campos_equipo)
+        for i in range(0, len(campos), 2):
+            equipo.añadir(Programador(campos[i], campos[i + 1]))
+        return equipo, None
+
+    @staticmethod
+    def _texto(valor):
+        # Un campo ausente cuenta como vacío; un valor que no es texto (número, lista...) es un formato inválido
+        if valor is None:
+            return ""
+        return valor.strip() if isinstance(valor, str) else None
+
+    @staticmethod
+    def _leer_json(ruta):
+        # Arreglo JSON de equipos; la "línea" de cada rechazo es la posición del equipo en el arreglo
+        with open(ruta, encoding="utf-8") as archivo:
+            try:
+                equipos = json.load(archivo)
+            except ValueError:
+                equipos = None
+        if isinstance(equipos, dict):
+            equipos = [equipos]
+        if not isinstance(equipos, list):
+            yield 1, None
+            return
+        for posicion, datos in enumerate(equipos, start=1):
+            yield posicion, datos if isinstance(datos, dict) else None
+
+    @staticmethod
+    def _leer_json_lines(ruta):
+        with open(ruta, encoding="utf-8") as archivo:
+            for linea, texto in enumerate(archivo, start=1):
+                if not texto.strip():
+                    continue
+                try:
+                    datos = json.loads(texto)
+                except ValueError:
+                    datos = None
+                yield linea, datos if isinstance(datos, dict) else None
+
+    @staticmethod
+    def _leer_csv(ruta):
+        columnas = ImportadorEquipos.COLUMNAS_EQUIPO
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            filas = csv.DictReader(archivo)
+            for clave, grupo in groupby(filas, key=lambda fila: tuple(fila.get(c) for c in columnas)):
+                linea = filas.line_num
+                # Basta con conservar un programador más que el máximo para detectar equipos llenos
+                miembros = list(islice(grupo, EquipoMaratonProgramacion.MAX_PROGRAMADORES + 1))
+                datos = dict(zip(columnas, clave))
+                datos["programadores"] = [{"nombre": m.get("nombre"), "apellidos": m.get("apellidos")} for m in miembros]
+                yield linea, datos
+
+
+# ==============================================================================
+# 4. Persistencia (SQLite)
+# ==============================================================================
+
+class AlmacenEquipos:
+    """
+    Guarda los equipos registrados en una base de datos SQLite local.
+    Las escrituras se agrupan en transacciones y las columnas universidad,
+    lenguajeProgramacion y nombreEquipo están indexadas para las consultas.
+    """
+
+    RUTA_PREDETERMINADA = "equipos_maraton.db"
+    EQUIPOS_POR_TRANSACCION = 1000
+
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS equipos (
+            id INTEGER PRIMARY KEY,
+            nombreEquipo TEXT NOT NULL,
+            universidad TEXT NOT NULL COLLATE NOCASE,
+            lenguajeProgramacion TEXT NOT NULL COLLATE NOCASE
+        );
+        CREATE TABLE IF NOT EXISTS programadores (
+            equipo_id INTEGER NOT NULL REFERENCES equipos (id),
+            nombre TEXT NOT NULL,
+            apellidos TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_equipos_universidad_lenguaje ON equipos (universidad, lenguajeProgramacion);
+        CREATE INDEX IF NOT EXISTS idx_equipos_lenguaje ON equipos (lenguajeProgramacion);
+        CREATE INDEX IF NOT EXISTS idx_equipos_nombre ON equipos (nombreEquipo);
+        CREATE INDEX IF NOT EXISTS idx_programadores_equipo ON programadores (equipo_id);
+        CREATE INDEX IF NOT EXISTS idx_programadores_persona ON programadores (nombre, apellidos);
+    """
+
+    def __init__(self, ruta: str = RUTA_PREDETERMINADA):
+        """:param ruta: Archivo de la base de datos (":memory:" para una base temporal)."""
+        self.conexion = sqlite3.connect(ruta)
+        self.conexion.execute("PRAGMA journal_mode = WAL")
+        self.conexion.execute("PRAGMA synchronous = NORMAL")
+        self.conexion.executescript(self.ESQUEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        self.conexion.close()
+
+    def __len__(self):
+        return self.conexion.execute("SELECT COUNT(*) FROM equipos").fetchone()[0]
+
+    def guardar(self, equipo: EquipoMaratonProgramacion):
+        self.guardar_varios([equipo])
+
+    @instrumentar
+    def guardar_varios(self, equipos):
+        """Guarda un lote de equipos con sus programadores en una única transacción."""
+        with self.conexion:
+            # Los identificadores se asignan aquí para poder insertar ambas tablas con executemany.
+            # BEGIN IMMEDIATE toma el bloqueo de escritura antes de leer MAX(id): sin él, otro proceso
+            # que escriba en la misma base podría calcular los mismos identificadores.
+            self.conexion.execute("BEGIN IMMEDIATE")
+            siguiente_id = self.conexion.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM equipos").fetchone()[0]
+            filas_equipos, filas_programadores = [], []
+            for equipo_id, equipo in enumerate(equipos, start=siguiente_id):
+                filas_equipos.append((equipo_id, equipo.nombreEquipo, equipo.universidad, equipo.lenguajeProgramacion))
+                filas_programadores.extend((equipo_id, p.nombre, p.apellidos) for p in equipo.programadores)
+            self.conexion.executemany(
+                "INSERT INTO equipos (id, nombreEquipo, universidad, lenguajeProgramacion) VALUES (?, ?, ?, ?)",
+                filas_equipos,
+            )
+            self.conexion.executemany(
+                "INSERT INTO programadores (equipo_id, nombre, apellidos) VALUES (?, ?, ?)",
+                filas_programadores,
+            )
+
+    @instrumentar
+    def buscar(self, universidad: str = None, lenguaje: str = None) -> list:
+        """
+        Equipos filtrados por universidad y/o lenguaje (sin distinguir mayúsculas).
+        :return: Lista de EquipoMaratonProgramacion en orden de registro.
+        """
+        condiciones, parametros = [], []
+        if universidad is not None:
+            condiciones.append("e.universidad = ?")
+            parametros.append(universidad)
+        if lenguaje is not None:
+            condiciones.append("e.lenguajeProgramacion = ?")
+            parametros.append(lenguaje)
+        donde = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        return self._consultar_equipos(donde, parametros)
+
+    def buscar_por_nombre(self, nombreEquipo: str) -> list:
+        return self._consultar_equipos("WHERE e.nombreEquipo = ?", [nombreEquipo])
+
+    @instrumentar
+    def programadores_duplicados(self) -> list:
+        """
+        Programadores (mismo nombre y apellidos) inscritos en más de un equipo.
+        :return: Lista de tuplas (nombre, apellidos, [nombres de los equipos]).
+        """
+        filas = self.conexion.execute("""
+            SELECT nombre, apellidos, group_concat(nombreEquipo, char(31))
+            FROM (
+                SELECT DISTINCT p.nombre, p.apellidos, p.equipo_id, e.nombreEquipo
+                FROM programadores AS p JOIN equipos AS e ON e.id = p.equipo_id
+            )
+            GROUP BY nombre, apellidos
+            HAVING COUNT(*) > 1
+        """)
+        return [(nombre, apellidos, equipos.split("\x1f")) for nombre, apellidos, equipos in filas]
+
+    def _consultar_equipos(self, donde, parametros):
+        filas = self.conexion.execute(f"""
+            SELECT e.id, e.nombreEquipo, e.universidad, e.lenguajeProgramacion, p.nombre, p.apellidos
+            FROM equipos AS e JOIN programadores AS p ON p.equipo_id = e.id
+            {donde}
+            ORDER BY e.id
+        """, parametros)
+        equipos = []
+        for _, grupo in groupby(filas, key=lambda fila: fila[0]):
+            grupo = list(grupo)
+            equipo = EquipoMaratonProgramacion(*grupo[0][1:4])
+            for fila in grupo:
+                equipo.añadir(Programador(fila[4], fila[5]))
+            equipos.append(equipo)
+        return equipos
+
+
+# ==============================================================================
+# 5. Línea de Comandos
+# ==============================================================================
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Importación masiva de equipos de la maratón de programación.")
+    parser.add_argument("--importar", metavar="ENTRADA", required=True, help="CSV, JSON Lines (.jsonl) o arreglo JSON (.json) con los equipos a importar")
+    parser.add_argument("--aceptados", default="equipos_aceptados.jsonl", help="JSON Lines con los equipos aceptados")
+    parser.add_argument("--rechazos", default="equipos_rechazados.csv", help="CSV con los equipos rechazados y el motivo")
+    parser.add_argument("--almacen", metavar="RUTA", help="Base de datos SQLite donde guardar también los equipos aceptados")
+    args = parser.parse_args(argv)
+
+    almacen = AlmacenEquipos(args.almacen) if args.almacen else None
+    try:
+        importador = ImportadorEquipos().importar(args.importar, args.aceptados, args.rechazos, almacen)
+    finally:
+        if almacen is not None:
+            almacen.cerrar()
+    print(f"{importador.aceptados} equipos aceptados, {importador.rechazados} rechazados "
+          f"en {importador.segundos:.2f} s ({importador.equipos_por_segundo:,.0f} equipos/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
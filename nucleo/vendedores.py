@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+"""
+Modelo de vendedores sin dependencias de GUI: la clase Vendedor, su
+almacenamiento por columnas y un registro indexado para consultas.
+"""
+
+import csv
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import attrgetter
+
+from nucleo.instrumentacion import instrumentar
+from nucleo.lotes import convertir_lote, numpy
+
+class Vendedor:
+    # Atributos: nombre, apellidos, edad. Con __slots__ cada instancia no necesita un __dict__
+    __slots__ = ("nombre", "apellidos", "edad")
+
+    # Códigos devueltos por comprobarEdad y validarEdades (mismas reglas que verificarEdad)
+    EDAD_VALIDA = 0
+    EDAD_MENOR = 1
+    EDAD_FUERA_DE_RANGO = 2
+    EDAD_NO_NUMERICA = 3
+
+    MENSAJES_EDAD = {
+        EDAD_MENOR: "El vendedor debe ser mayor de 18 años.",
+        EDAD_FUERA_DE_RANGO: "La edad no puede ser negativa ni mayor a 120.",
+    }
+
+    def __init__(self, nombre, apellidos):
+        self.nombre = nombre
+        self.apellidos = apellidos
+        self.edad = 0
+
+    # Texto con los datos del vendedor
+    def descripcion(self):
+        info = f"Nombre del vendedor = {self.nombre}\n"
+        info += f"Apellidos del vendedor = {self.apellidos}\n"
+        info += f"Edad del vendedor = {self.edad}"
+        return info
+
+    # Muestra los datos del vendedor; tkinter solo se importa cuando se usa la GUI
+    def imprimir(self):
+        from tkinter import messagebox
+        messagebox.showinfo("Datos del vendedor", self.descripcion())
+
+    # Devuelve el código de la edad sin lanzar excepciones
+    @staticmethod
+    def comprobarEdad(edad):
+        if 0 < edad < 18:
+            return Vendedor.EDAD_MENOR
+        if edad < 0 or edad > 120:
+            return Vendedor.EDAD_FUERA_DE_RANGO
+        return Vendedor.EDAD_VALIDA
+
+    # Asigna la edad si es válida y devuelve su código; la edad no cambia si hay error
+    def asignarEdad(self, edad):
+        codigo = Vendedor.comprobarEdad(edad)
+        if codigo == Vendedor.EDAD_VALIDA:
+            self.edad = edad
+        return codigo
+
+    # Verifica que la edad sea válida
+    def verificarEdad(self, edad):
+        codigo = self.asignarEdad(edad)
+        if codigo != Vendedor.EDAD_VALIDA:
+            raise ValueError(Vendedor.MENSAJES_EDAD[codigo])
+
+    # Valida una columna de edades de una sola vez y devuelve (edades, códigos)
+    @staticmethod
+    @instrumentar
+    def validarEdades(edades):
+        edades, no_numericas = convertir_lote(edades, entero=True)
+        np = numpy()
+        if np is not None:
+            codigos = np.zeros(edades.size, dtype=np.uint8)
+            codigos[(edades > 0) & (edades < 18)] = Vendedor.EDAD_MENOR
+            codigos[(edades < 0) | (edades > 120)] = Vendedor.EDAD_FUERA_DE_RANGO
+            codigos[no_numericas] = Vendedor.EDAD_NO_NUMERICA
+            return edades, codigos
+
+        codigos = array("B", bytes(len(edades)))
+        for i, edad in enumerate(edades):
+            if no_numericas[i]:
+                codigos[i] = Vendedor.EDAD_NO_NUMERICA
+            elif 0 < edad < 18:
+                codigos[i] = Vendedor.EDAD_MENOR
+            elif edad < 0 or edad > 120:
+                codigos[i] = Vendedor.EDAD_FUERA_DE_RANGO
+        return edades, codigos
+
+
+#Las excepciones IllegalArgumentException usadas en Java se reemplazaron por ValueError, que es la más similar en Python.
+
+
+# Almacena muchos vendedores como columnas (estructura de arreglos) en lugar de un objeto por vendedor
+class TablaVendedores:
+    FILAS_POR_BLOQUE = 50_000
+
+    def __init__(self):
+        self.nombres = []
+        self.apellidos = []
+        self.edades = array("B")  # Las edades válidas caben en un byte (0 a 120)
+
+    def __len__(self):
+        return len(self.edades)
+
+    def __getitem__(self, indice):
+        vendedor = Vendedor(self.nombres[indice], self.apellidos[indice])
+        vendedor.edad = self.edades[indice]
+        return vendedor
+
+    def __iter__(self):
+        for indice in range(len(self)):
+            yield self[indice]
+
+    # Lee un CSV nombre,apellidos,edad por bloques; valida las edades de cada bloque de una vez
+    # y devuelve (tabla, rechazos) con los rechazos como pares (número de fila, código)
+    @classmethod
+    @instrumentar
+    def cargar(cls, ruta, encabezado=False):
+        tabla = cls()
+        rechazos = []
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            lector = csv.reader(archivo)
+            if encabezado:
+                next(lector, None)
+            fila_inicial = 2 if encabezado else 1
+            while True:
+                bloque = list(islice(lector, cls.FILAS_POR_BLOQUE))
+                if not bloque:
+                    return tabla, rechazos
+                tabla._añadir_bloque(bloque, fila_inicial, rechazos)
+                fila_inicial += len(bloque)
+
+    def _añadir_bloque(self, bloque, fila_inicial, rechazos):
+        edades, codigos = Vendedor.validarEdades([fila[2] if len(fila) > 2 else "" for fila in bloque])
+        for i, codigo in enumerate(codigos.tolist()):
+            if codigo:
+                rechazos.append((fila_inicial + i, codigo))
+            else:
+                self.nombres.append(bloque[i][0])
+                self.apellidos.append(bloque[i][1])
+                self.edades.append(edades[i])
+
+
+# Colección consultable de vendedores: índices hash por nombre y apellidos, e índices ordenados
+# por edad (consultas por rango) y por apellidos (búsqueda por prefijo).
+# La edad de cada vendedor debe estar fijada antes de registrarlo.
+class RegistroVendedores:
+    # Las altas se guardan en listas pendientes pequeñas y ordenadas que las consultas combinan
+    # con los índices principales; solo al superar este tamaño se fusionan con ellos
+    LIMITE_PENDIENTES = 4096
+
+    def __init__(self):
+        self.vendedores = []
+        self._por_nombre = {}
+        self._por_apellidos = {}
+        # Índices ordenados: los vendedores y, en paralelo, sus claves para buscar con bisect
+        self._ordenados_por_edad = []
+        self._edades = []
+        self._ordenados_por_apellidos = []
+        self._apellidos = []
+        self._pendientes_por_edad = []
+        self._edades_pendientes = []
+        self._pendientes_por_apellidos = []
+        self._apellidos_pendientes = []
+        self._nuevos = []
+
+    @classmethod
+    def desde_tabla(cls, tabla):
+        registro = cls()
+        registro.agregar_varios(tabla)
+        return registro
+
+    def __len__(self):
+        return len(self.vendedores)
+
+    def agregar(self, vendedor):
+        self.vendedores.append(vendedor)
+        self._por_nombre.setdefault(vendedor.nombre, []).append(vendedor)
+        self._por_apellidos.setdefault(vendedor.apellidos, []).append(vendedor)
+        self._nuevos.append(vendedor)
+
+    def agregar_varios(self, vendedores):
+        for vendedor in vendedores:
+            self.agregar(vendedor)
+
+    @instrumentar
+    def buscar_por_nombre(self, nombre):
+        return list(self._por_nombre.get(nombre, ()))
+
+    @instrumentar
+    def buscar_por_apellidos(self, apellidos):
+        return list(self._por_apellidos.get(apellidos, ()))
+
+    @instrumentar
+    def buscar_por_edad(self, minima, maxima):
+        # Vendedores con minima <= edad <= maxima, ordenados por edad
+        self._actualizar_indices()
+        return self._buscar_rango(self._edades, self._ordenados_por_edad,
+                                  self._edades_pendientes, self._pendientes_por_edad,
+                                  bisect_left(self._edades, minima), bisect_right(self._edades, maxima),
+                                  bisect_left(self._edades_pendientes, minima),
+                                  bisect_right(self._edades_pendientes, maxima))
+
+    @instrumentar
+    def buscar_por_prefijo_apellidos(self, prefijo):
+        # Vendedores cuyos apellidos empiezan por `prefijo`, ordenados por apellidos
+        self._actualizar_indices()
+        limite = prefijo + "\U0010ffff"
+        return self._buscar_rango(self._apellidos, self._ordenados_por_apellidos,
+                                  self._apellidos_pendientes, self._pendientes_por_apellidos,
+                                  bisect_left(self._apellidos, prefijo), bisect_left(self._apellidos, limite),
+                                  bisect_left(self._apellidos_pendientes, prefijo),
+                                  bisect_left(self._apellidos_pendientes, limite))
+
+    @staticmethod
+    def _buscar_rango(claves, vendedores, claves_pendientes, pendientes, inicio, fin, inicio_pendientes, fin_pendientes):
+        # Intercala el tramo de las pendientes en el tramo [inicio, fin) del índice principal
+        # sin copiar sus claves: solo hace falta la lista de vendedores resultante
+        if inicio_pendientes == fin_pendientes:
+            return vendedores[inicio:fin]
+        resultado = []
+        anterior = inicio
+        for i in range(inicio_pendientes, fin_pendientes):
+            posicion = bisect_right(claves, claves_pendientes[i], anterior, fin)
+            resultado += vendedores[anterior:posicion]
+            resultado.append(pendientes[i])
+            anterior = posicion
+        resultado += vendedores[anterior:fin]
+        return resultado
+
+    @staticmethod
+    def _fusionar(claves, vendedores, claves_nuevas, nuevos):
+        # Intercala una lista ordenada corta en otra larga copiando tramos enteros entre las
+        # posiciones de inserción: el coste en Python depende de la corta, no de la larga
+        claves_resultado, resultado = [], []
+        anterior = 0
+        for clave, vendedor in zip(claves_nuevas, nuevos):
+            posicion = bisect_right(claves, clave, anterior)
+            claves_resultado += claves[anterior:posicion]
+            claves_resultado.append(clave)
+            resultado += vendedores[anterior:posicion]
+            resultado.append(vendedor)
+            anterior = posicion
+        claves_resultado += claves[anterior:]
+        resultado += vendedores[anterior:]
+        return claves_resultado, resultado
+
+    @instrumentar
+    def _actualizar_indices(self):
+        if not self._nuevos:
+            return
+        nuevos, self._nuevos = self._nuevos, []
+        if len(nuevos) + len(self._pendientes_por_edad) <= self.LIMITE_PENDIENTES:
+            # Pocas altas: se insertan en las listas pendientes, que son cortas
+            for vendedor in nuevos:
+                posicion = bisect_right(self._edades_pendientes, vendedor.edad)
+                self._edades_pendientes.insert(posicion, vendedor.edad)
+                self._pendientes_por_edad.insert(posicion, vendedor)
+                posicion = bisect_right(self._apellidos_pendientes, vendedor.apellidos)
+                self._apellidos_pendientes.insert(posicion, vendedor.apellidos)
+                self._pendientes_por_apellidos.insert(posicion, vendedor)
+            return
+
+        nuevos += self._pendientes_por_edad
+        self._pendientes_por_edad, self._edades_pendientes = [], []
+        self._pendientes_por_apellidos, self._apellidos_pendientes = [], []
+        if len(nuevos) * 8 > len(self._ordenados_por_edad):
+            # Carga masiva: reordenar todo es más barato que fusionar elemento a elemento
+            self._ordenados_por_edad += nuevos
+            self._ordenados_por_edad.sort(key=attrgetter("edad"))
+            self._edades = [vendedor.edad for vendedor in self._ordenados_por_edad]
+            self._ordenados_por_apellidos += nuevos
+            self._ordenados_por_apellidos.sort(key=attrgetter("apellidos"))
+            self._apellidos = [vendedor.apellidos for vendedor in self._ordenados_por_apellidos]
+            return
+
+        # Muchas altas sobre un índice grande: se ordenan aparte y se intercalan en él
+        por_edad = sorted(nuevos, key=attrgetter("edad"))
+        self._edades, self._ordenados_por_edad = self._fusionar(
+            self._edades, self._ordenados_por_edad, [vendedor.edad for vendedor in por_edad], por_edad)
+        por_apellidos = sorted(nuevos, key=attrgetter("apellidos"))
+        self._apellidos, self._ordenados_por_apellidos = self._fusionar(
+            self._apellidos, self._ordenados_por_apellidos,
+            [vendedor.apellidos for vendedor in por_apellidos], por_apellidos)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Escrituras concurrentes en la misma base de AlmacenEquipos."""
+
+import os
+import tempfile
+import threading
+import unittest
+
+from nucleo.maraton import AlmacenEquipos, EquipoMaratonProgramacion, Programador
+
+
+def _equipos(prefijo, cantidad):
+    equipos = []
+    for i in range(cantidad):
+        equipo = EquipoMaratonProgramacion(f"{prefijo}{i}", "UNAL", "Python")
+        equipo.añadir(Programador("Ana", "Ruiz"))
+        equipo.añadir(Programador("Luis", "Gómez"))
+        equipos.append(equipo)
+    return equipos
+
+
+class TestGuardarVariosConcurrente(unittest.TestCase):
+
+    def test_dos_conexiones_no_repiten_identificadores(self):
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "equipos.db")
+            AlmacenEquipos(ruta).cerrar()
+            errores = []
+
+            def escribir(prefijo):
+                with AlmacenEquipos(ruta) as almacen:
+                    for _ in range(20):
+                        try:
+                            almacen.guardar_varios(_equipos(prefijo, 50))
+                        except Exception as e:
+                            errores.append(e)
+
+            hilos = [threading.Thread(target=escribir, args=(prefijo,)) for prefijo in "ABC"]
+            for hilo in hilos:
+                hilo.start()
+            for hilo in hilos:
+                hilo.join()
+
+            self.assertEqual(errores, [])
+            with AlmacenEquipos(ruta) as almacen:
+                self.assertEqual(len(almacen), 3 * 20 * 50)
+                programadores = almacen.conexion.execute("SELECT COUNT(*) FROM programadores").fetchone()[0]
+                self.assertEqual(programadores, 2 * len(almacen))
+
+
+if __name__ == "__main__":
+    unittest.main()
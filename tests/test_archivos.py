@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Lectura de archivos mapeados en memoria con LeerArchivoMapeado."""
+
+import os
+import tempfile
+import unittest
+
+from nucleo.archivos import LeerArchivoMapeado
+
+
+class TestLeerArchivoMapeado(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(self.carpeta.cleanup)
+
+    def _abrir(self, contenido):
+        ruta = os.path.join(self.carpeta.name, "archivo.txt")
+        with open(ruta, "wb") as archivo:
+            archivo.write(contenido)
+        fuente = LeerArchivoMapeado(ruta)
+        self.addCleanup(fuente.cerrar)
+        fuente.construir_indice()
+        return fuente
+
+    def test_bytes_no_utf8_se_reemplazan(self):
+        fuente = self._abrir("línea uno\n".encode("utf-8") + b"dos \xff\xfe\n" + "tres\r\n".encode("utf-8"))
+        self.assertEqual(fuente.lineas(0, 3), "línea uno\ndos ��\ntres\n")
+        self.assertEqual(fuente.linea(1, mayusculas=True), "DOS ��\n")
+
+    def test_cerrar_dos_veces(self):
+        fuente = self._abrir(b"uno\ndos\n")
+        fuente.cerrar()
+        fuente.cerrar()
+        self.assertTrue(fuente._archivo.closed)
+
+    def test_cerrar_con_vistas_exportadas_cierra_el_archivo(self):
+        fuente = self._abrir(b"uno\ndos\n")
+        vista = fuente.bytes_rango(0, 3)
+        with self.assertRaises(BufferError):
+            fuente.cerrar()
+        self.assertTrue(fuente._archivo.closed)
+        self.assertEqual(bytes(vista), b"uno")
+        fuente.cerrar()  # ya cerrado: no vuelve a fallar
+        vista.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""dividirLote debe dar los mismos resultados y estados con NumPy y sin él, sin avisos."""
+
+import math
+import unittest
+import warnings
+from unittest import mock
+
+from nucleo import division, lotes
+from nucleo.division import PruebaExcepciones
+
+OK = PruebaExcepciones.ESTADO_OK
+CERO = PruebaExcepciones.ESTADO_DIVISION_CERO
+INVALIDO = PruebaExcepciones.ESTADO_INVALIDO
+
+
+class TestDividirLote(unittest.TestCase):
+
+    def _dividir(self, numeradores, denominadores):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            resultados, estados = PruebaExcepciones.dividirLote(numeradores, denominadores)
+        return [float(r) for r in resultados], [int(e) for e in estados]
+
+    def test_desbordamiento_divisor_cero_y_cero_entre_cero(self):
+        numeradores = [1e308, 1, 0, math.inf, -1e308, "x", 6]
+        denominadores = [1e-308, 0, 0, math.inf, 1e-308, 1, 3]
+        with mock.patch.object(lotes, "numpy", lambda: None), mock.patch.object(division, "numpy", lambda: None):
+            esperado = self._dividir(numeradores, denominadores)
+        self.assertEqual(esperado[1], [OK, CERO, CERO, OK, OK, INVALIDO, OK])
+        self.assertEqual(str(esperado[0]), str([math.inf, math.nan, math.nan, math.nan, -math.inf, math.nan, 2.0]))
+        if lotes.numpy() is None:
+            self.skipTest("NumPy no está instalado")
+        self.assertEqual(str(self._dividir(numeradores, denominadores)), str(esperado))
+
+
+if __name__ == "__main__":
+    unittest.main()
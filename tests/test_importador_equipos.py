@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Registros mal formados en la importación masiva de equipos de la maratón."""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from nucleo.maraton import ImportadorEquipos
+
+EQUIPO_VALIDO = {
+    "nombreEquipo": "Los Bits",
+    "universidad": "UNAL",
+    "lenguajeProgramacion": "Python",
+    "programadores": [{"nombre": "Ana", "apellidos": "Ruiz"}, {"nombre": "Luis", "apellidos": "Gómez"}],
+}
+
+
+def _equipo(**cambios):
+    return {**EQUIPO_VALIDO, **cambios}
+
+
+class TestConstruirEquipo(unittest.TestCase):
+
+    def test_equipo_valido(self):
+        equipo, motivo = ImportadorEquipos.construir_equipo(EQUIPO_VALIDO)
+        self.assertIsNone(motivo)
+        self.assertEqual(equipo.tamañoEquipo, 2)
+
+    def test_registros_mal_formados(self):
+        casos = (
+            _equipo(programadores="abc"),
+            _equipo(programadores=[1, 2]),
+            _equipo(programadores=5),
+            _equipo(programadores=[{"nombre": 7, "apellidos": "Ruiz"}, {"nombre": "Luis", "apellidos": "Gómez"}]),
+            _equipo(universidad=["UNAL"]),
+        )
+        for datos in casos:
+            with self.subTest(datos=datos):
+                self.assertEqual(ImportadorEquipos.construir_equipo(datos), (None, "formato_invalido"))
+
+
+class TestImportar(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(self.carpeta.cleanup)
+
+    def _ruta(self, nombre):
+        return os.path.join(self.carpeta.name, nombre)
+
+    def _importar(self, nombre, contenido):
+        with open(self._ruta(nombre), "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        importador = ImportadorEquipos().importar(
+            self._ruta(nombre), self._ruta("aceptados.jsonl"), self._ruta("rechazos.csv"))
+        with open(self._ruta("rechazos.csv"), newline="", encoding="utf-8") as archivo:
+            rechazos = list(csv.DictReader(archivo))
+        return importador, rechazos
+
+    def test_json_lines_con_registros_mal_formados(self):
+        lineas = [EQUIPO_VALIDO, _equipo(programadores="abc"), _equipo(programadores=[1, 2]),
+                  _equipo(programadores=5), EQUIPO_VALIDO]
+        importador, rechazos = self._importar("equipos.jsonl", "\n".join(json.dumps(d) for d in lineas))
+        self.assertEqual((importador.aceptados, importador.rechazados), (2, 3))
+        self.assertEqual([r["linea"] for r in rechazos], ["2", "3", "4"])
+        self.assertEqual({r["motivo"] for r in rechazos}, {"formato_invalido"})
+
+    def test_arreglo_json_con_formato_legible(self):
+        equipos = [EQUIPO_VALIDO, _equipo(nombreEquipo="Otro", programadores=5)]
+        importador, rechazos = self._importar("equipos.json", json.dumps(equipos, indent=2))
+        self.assertEqual((importador.aceptados, importador.rechazados), (1, 1))
+        self.assertEqual(rechazos[0]["linea"], "2")
+
+    def test_json_invalido(self):
+        importador, rechazos = self._importar("equipos.json", "[{")
+        self.assertEqual((importador.aceptados, importador.rechazados), (0, 1))
+        self.assertEqual(rechazos[0]["motivo"], "formato_invalido")
+
+
+if __name__ == "__main__":
+    unittest.main()
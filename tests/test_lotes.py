@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""convertir_lote debe dar el mismo resultado con NumPy y con el módulo array."""
+
+import math
+import unittest
+from unittest import mock
+
+from nucleo import lotes, vendedores
+
+MIXTOS = ["30", 30.7, "x", "", None, 2 ** 70, "-5", 17]
+# Decimales que astype(int64) convertía en INT64_MIN sin marcarlos como no numéricos
+DECIMALES_EXTREMOS = [30.5, math.nan, 1e30, 17.9, -0.5, math.inf, -math.inf, 2.0 ** 63, -2.0 ** 63]
+
+
+def _listas(resultado):
+    numeros, no_numericos = resultado
+    return [float(n) for n in numeros], [bool(m) for m in no_numericos]
+
+
+class TestConvertirLote(unittest.TestCase):
+
+    def _comparar(self, valores, entero, con_numpy=None):
+        sin_numpy = mock.patch.object(lotes, "numpy", lambda: None)
+        with sin_numpy:
+            esperado = _listas(lotes.convertir_lote(valores, entero))
+        np = lotes.numpy()
+        if np is None:
+            self.skipTest("NumPy no está instalado")
+        if con_numpy is not None:
+            valores = con_numpy(np, valores)
+        obtenido = _listas(lotes.convertir_lote(valores, entero))
+        self.assertEqual(str(obtenido), str(esperado))  # str para comparar NaN con NaN
+        return obtenido
+
+    def test_enteros_mixtos(self):
+        self._comparar(MIXTOS, entero=True)
+
+    def test_decimales_mixtos(self):
+        self._comparar(MIXTOS[:5] + ["1e3", "12,5"], entero=False)
+
+    def test_edad_decimal_en_lista_de_textos(self):
+        numeros, no_numericos = lotes.convertir_lote(["30", 30.7, "x"], entero=True)
+        self.assertEqual([int(n) for n in numeros], [30, 30, 0])
+        self.assertEqual([bool(m) for m in no_numericos], [False, False, True])
+
+    def test_decimales_extremos_a_entero(self):
+        numeros, no_numericos = self._comparar(DECIMALES_EXTREMOS, entero=True)
+        self.assertEqual(numeros, [30, 0, 0, 17, 0, 0, 0, 0, -2 ** 63])
+        self.assertEqual(no_numericos, [False, True, True, False, False, True, True, True, False])
+
+    def test_arreglo_de_decimales(self):
+        for dtype in ("float64", "float32"):
+            with self.subTest(dtype=dtype):
+                self._comparar(DECIMALES_EXTREMOS, entero=True, con_numpy=lambda np, v: np.array(v, dtype=dtype))
+        self._comparar(DECIMALES_EXTREMOS, entero=False, con_numpy=lambda np, v: np.array(v, dtype=np.float64))
+
+    def test_arreglo_sin_signo_fuera_de_rango(self):
+        self._comparar([1, 2 ** 63, 2 ** 64 - 1], entero=True, con_numpy=lambda np, v: np.array(v, dtype=np.uint64))
+
+
+class TestValidarEdades(unittest.TestCase):
+
+    def test_mismos_codigos_con_y_sin_numpy(self):
+        edades = [30.5, math.nan, 1e30, 17.9, -0.5]
+        with mock.patch.object(lotes, "numpy", lambda: None), mock.patch.object(vendedores, "numpy", lambda: None):
+            esperado = list(vendedores.Vendedor.validarEdades(edades)[1])
+        self.assertEqual(esperado, [0, 3, 3, 1, 0])
+        if lotes.numpy() is None:
+            self.skipTest("NumPy no está instalado")
+        self.assertEqual([int(c) for c in vendedores.Vendedor.validarEdades(edades)[1]], esperado)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Consultas por rango de edad y prefijo de apellidos después de dar de alta vendedores."""
+
+import random
+import unittest
+
+from nucleo.vendedores import RegistroVendedores, Vendedor
+
+
+def _vendedores(cantidad, semilla):
+    aleatorio = random.Random(semilla)
+    vendedores = []
+    for _ in range(cantidad):
+        vendedor = Vendedor(f"Nombre{aleatorio.randint(0, 50)}", f"Apellido{aleatorio.randint(0, 500)}")
+        vendedor.edad = aleatorio.randint(18, 80)
+        vendedores.append(vendedor)
+    return vendedores
+
+
+class TestConsultasTrasAltas(unittest.TestCase):
+
+    def setUp(self):
+        self.registro = RegistroVendedores.desde_tabla(_vendedores(20_000, semilla=1))
+        self.registro.buscar_por_edad(0, 0)  # construye los índices
+
+    def _comprobar(self):
+        todos = self.registro.vendedores
+        for minima, maxima in ((30, 40), (18, 18), (80, 90), (41, 29)):
+            with self.subTest(minima=minima, maxima=maxima):
+                obtenido = self.registro.buscar_por_edad(minima, maxima)
+                self.assertEqual([v.edad for v in obtenido], sorted(v.edad for v in obtenido))
+                self.assertCountEqual(obtenido, [v for v in todos if minima <= v.edad <= maxima])
+        for prefijo in ("Apellido12", "Apellido5", "Apellido499", "Otro"):
+            with self.subTest(prefijo=prefijo):
+                obtenido = self.registro.buscar_por_prefijo_apellidos(prefijo)
+                self.assertEqual([v.apellidos for v in obtenido], sorted(v.apellidos for v in obtenido))
+                self.assertCountEqual(obtenido, [v for v in todos if v.apellidos.startswith(prefijo)])
+
+    def test_altas_sueltas_entre_consultas(self):
+        for vendedor in _vendedores(300, semilla=2):
+            self.registro.agregar(vendedor)
+            self.assertIn(vendedor, self.registro.buscar_por_edad(vendedor.edad, vendedor.edad))
+        self._comprobar()
+
+    def test_altas_por_encima_del_limite_de_pendientes(self):
+        self.registro.agregar_varios(_vendedores(RegistroVendedores.LIMITE_PENDIENTES - 10, semilla=3))
+        self._comprobar()
+        self.registro.agregar_varios(_vendedores(100, semilla=4))
+        self._comprobar()
+        self.assertEqual(self.registro._pendientes_por_edad, [])
+
+    def test_carga_masiva_sobre_registro_pequeño(self):
+        registro = RegistroVendedores.desde_tabla(_vendedores(10, semilla=5))
+        registro.buscar_por_edad(0, 0)
+        registro.agregar_varios(_vendedores(RegistroVendedores.LIMITE_PENDIENTES + 1, semilla=6))
+        self.registro = registro
+        self._comprobar()
+
+
+if __name__ == "__main__":
+    unittest.main()